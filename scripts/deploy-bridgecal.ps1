@@ -584,7 +584,7 @@ if (-not $SkipScheduledTask) {
     if ($createTask) {
         $taskName = "BridgeCal Sync Agent"
         $runnerPath = (Resolve-Path (Join-Path $RepoRoot "scripts\\run-bridgecal-daemon.ps1")).Path
-        $psExe = (Get-Command powershell.exe).Source
+        $psExe = Join-Path $env:SystemRoot 'System32\WindowsPowerShell\v1.0\powershell.exe'
         $taskArgs = "-NoProfile -ExecutionPolicy Bypass -File `"$runnerPath`" -IntervalSeconds $IntervalSeconds -ConfigPath `"$configPath`""
         $currentUser = [System.Security.Principal.WindowsIdentity]::GetCurrent().Name
 
@@ -5,12 +5,13 @@ import logging
 import os
 import re
 import unicodedata
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import CancelledError
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, time, timedelta, tzinfo
 from importlib import import_module, util
-from threading import Lock, Thread
+from threading import Event, Lock, Thread
 from typing import Any, Literal
 
 from .sync.models import CanonicalEvent
@@ -79,6 +80,7 @@ def parse_natural_schedule_request(
     max_new_tokens: int | None = None,
     force_thinking: bool = False,
     on_model_output_chunk: Callable[[str], None] | None = None,
+    cancel_event: Event | None = None,
 ) -> ParsedScheduleRequest:
     normalized = _normalize_text(text)
     if not normalized:
@@ -108,6 +110,7 @@ def parse_natural_schedule_request(
         model_id=selected_model_id,
         thinking_mode=thinking_mode,
         on_text_chunk=on_model_output_chunk,
+        cancel_event=cancel_event,
     )
     payload = _json_object_from_text(generated)
     return _build_schedule_request_from_payload(payload, fallback_tz=local_tz)
@@ -122,6 +125,7 @@ def parse_natural_time_range(
     max_new_tokens: int | None = None,
     force_thinking: bool = False,
     on_model_output_chunk: Callable[[str], None] | None = None,
+    cancel_event: Event | None = None,
 ) -> QueryTimeRange:
     parsed = parse_natural_schedule_request(
         text=text,
@@ -131,6 +135,7 @@ def parse_natural_time_range(
         max_new_tokens=max_new_tokens,
         force_thinking=force_thinking,
         on_model_output_chunk=on_model_output_chunk,
+        cancel_event=cancel_event,
     )
     return parsed.query_range
 
@@ -139,15 +144,15 @@ def check_availability(
     *,
     query_text: str,
     query_range: QueryTimeRange,
-    outlook_events: list[CanonicalEvent],
-    google_events: list[CanonicalEvent],
+    outlook_events: Iterable[CanonicalEvent],
+    google_events: Iterable[CanonicalEvent],
 ) -> AvailabilityResult:
     window_start_utc = _to_utc(query_range.start)
     window_end_utc = _to_utc(query_range.end)
 
     conflicts: list[AvailabilityConflict] = []
     seen: set[tuple[str, str, str]] = set()
-    event_sets: tuple[tuple[AvailabilityOrigin, list[CanonicalEvent]], ...] = (
+    event_sets: tuple[tuple[AvailabilityOrigin, Iterable[CanonicalEvent]], ...] = (
         ("outlook", outlook_events),
         ("google", google_events),
     )
@@ -204,7 +209,9 @@ def _lfm_generate_local_json_response(
     model_id: str,
     thinking_mode: bool | None = None,
     on_text_chunk: Callable[[str], None] | None = None,
+    cancel_event: Event | None = None,
 ) -> str:
+    _raise_if_cancelled(cancel_event)
     pipe = _lfm_transformers_pipeline(model_id=model_id)
     effective_thinking_mode = (
         _uses_reasoning_output_mode(model_id) if thinking_mode is None else thinking_mode
@@ -257,6 +264,7 @@ def _lfm_generate_local_json_response(
         model_id=model_id,
         assistant_prefill=assistant_prefill,
         on_text_chunk=on_text_chunk,
+        cancel_event=cancel_event,
     )
 
 
@@ -331,7 +339,9 @@ def _run_generation(
     model_id: str,
     assistant_prefill: str,
     on_text_chunk: Callable[[str], None] | None = None,
+    cancel_event: Event | None = None,
 ) -> str:
+    _raise_if_cancelled(cancel_event)
     if torch is not None:
         manual_seed = getattr(torch, "manual_seed", None)
         if callable(manual_seed):
@@ -346,6 +356,10 @@ def _run_generation(
     if isinstance(eos_token_id, int):
         generation_kwargs["eos_token_id"] = eos_token_id
         generation_kwargs["pad_token_id"] = eos_token_id
+    if cancel_event is not None:
+        stopping_criteria = _cancel_stopping_criteria(cancel_event)
+        if stopping_criteria is not None:
+            generation_kwargs["stopping_criteria"] = stopping_criteria
 
     streamed_text = _run_generation_with_streamer(
         pipe=pipe,
@@ -353,6 +367,7 @@ def _run_generation(
         generation_kwargs=generation_kwargs,
         on_text_chunk=on_text_chunk,
     )
+    _raise_if_cancelled(cancel_event)
     if streamed_text is not None:
         text = streamed_text
         if assistant_prefill and not text.lstrip().startswith(assistant_prefill):
@@ -370,6 +385,7 @@ def _run_generation(
         outputs = pipe(prompt, **generation_kwargs)
     except Exception as exc:
         raise RuntimeError("LFM local generation via transformers failed.") from exc
+    _raise_if_cancelled(cancel_event)
 
     text = _extract_transformers_generated_text(outputs)
     if assistant_prefill and not text.lstrip().startswith(assistant_prefill):
@@ -381,6 +397,19 @@ def _run_generation(
     return text
 
 
+def _raise_if_cancelled(cancel_event: Event | None) -> None:
+    if cancel_event is not None and cancel_event.is_set():
+        raise CancelledError("Availability parsing was cancelled.")
+
+
+def _cancel_stopping_criteria(cancel_event: Event) -> Any | None:
+    criteria_list_cls = getattr(transformers, "StoppingCriteriaList", None)
+    if criteria_list_cls is None:
+        return None
+    # Checked once per generated token, so a cancel stops the model mid-sequence.
+    return criteria_list_cls([lambda *_args, **_kwargs: cancel_event.is_set()])
+
+
 def _run_generation_with_streamer(
     *,
     pipe: Any,
@@ -52,15 +52,13 @@ def availability(
         raise typer.Exit(code=4) from None
 
     try:
-        outlook_events = list(OutlookClient().list_events(query_range.start, query_range.end))
-        google_events = list(
-            GoogleClient(
-                calendar_id=cfg.google.calendar_id,
-                client_secret_path=cfg.google.client_secret_path,
-                token_path=cfg.google.token_path,
-                insecure_tls_skip_verify=cfg.google.insecure_tls_skip_verify,
-            ).list_events(query_range.start, query_range.end)
-        )
+        outlook_events = OutlookClient().list_events(query_range.start, query_range.end)
+        google_events = GoogleClient(
+            calendar_id=cfg.google.calendar_id,
+            client_secret_path=cfg.google.client_secret_path,
+            token_path=cfg.google.token_path,
+            insecure_tls_skip_verify=cfg.google.insecure_tls_skip_verify,
+        ).list_events(query_range.start, query_range.end)
     except Exception:
         logger.exception("Availability check failed")
         raise typer.Exit(code=4) from None
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import import_module, util
 from pathlib import Path
 
 import typer
 
 CONFIG_OPTION = typer.Option(None, "--config", help="Path to config.toml")
+# Modules already imported by an earlier preload in this process.
+_PRELOADED: set[str] = set()
 
 
 def gui(config: Path | None = CONFIG_OPTION) -> None:
     """Launch the BridgeCal Windows GUI."""
     _preload_gui_ml_runtime()
+    _prewarm_speech_model()
 
     try:
         from ..gui_app import launch_gui
@@ -36,15 +40,27 @@ def _preload_gui_ml_runtime() -> None:
     can fail with WinError 1114. Preloading here avoids that import order.
     """
     for module_name in ("torch", "ctranslate2", "faster_whisper"):
-        if not _module_exists(module_name):
+        if module_name in _PRELOADED or not _module_exists(module_name):
             continue
         try:
             _import_runtime_module(module_name)
         except Exception:
             # Voice/STT remains optional; GUI can still launch.
             return
+        _PRELOADED.add(module_name)
 
 
+def _prewarm_speech_model() -> None:
+    """Start the optional Whisper warm-up; the voice stack stays optional for the GUI."""
+    try:
+        from ..voice_stt import prewarm_whisper_async
+
+        prewarm_whisper_async()
+    except Exception:
+        return
+
+
+@lru_cache(maxsize=16)
 def _module_exists(module_name: str) -> bool:
     return util.find_spec(module_name) is not None
 
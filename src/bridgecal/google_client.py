@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import replace
 from datetime import UTC, date, datetime, timedelta
 from importlib import import_module, util
@@ -48,6 +48,9 @@ SCOPES = ["https://www.googleapis.com/auth/calendar"]
 MARKER_ORIGIN_KEY = "bridgecal.origin"
 MARKER_OUTLOOK_ID_KEY = "bridgecal.outlook_id"
 UTF8_BOM = b"\xef\xbb\xbf"
+# Calendar API guidance caps a batch at 50 calls.
+GOOGLE_BATCH_LIMIT = 50
+GOOGLE_GONE_STATUSES = frozenset({404, 410})
 
 
 def _load_json_object(path: Path, *, label: str) -> dict[str, Any]:
@@ -150,47 +153,96 @@ class GoogleClient:
                 return events
 
     def upsert_mirror(self, source: CanonicalEvent) -> str:
-        mirror_id = self._find_outlook_mirror(source.source_id)
-        payload = self._mirror_payload(source)
+        mirror_id = self._first_item_id(self._mirror_lookup_request(source.source_id).execute())
+        result = self._mirror_write_request(source, mirror_id).execute()
+        return str(result["id"])
 
-        events_api = self._service_handle().events()
-        if mirror_id:
-            result = events_api.patch(
-                calendarId=self.calendar_id,
-                eventId=mirror_id,
-                body=payload,
-                sendUpdates="none",
-            ).execute()
-            return str(result["id"])
+    def upsert_mirrors(
+        self,
+        sources: Sequence[CanonicalEvent],
+        on_upserted: Callable[[CanonicalEvent, str], None],
+    ) -> None:
+        """Upsert many mirrors with batched HTTP calls: one lookup batch, then one write batch.
+
+        ``on_upserted`` runs for each success as responses arrive. The first failure is
+        re-raised once every batch has been sent.
+        """
+        if not sources:
+            return
+        service = self._service_handle()
+        errors: list[Exception] = []
+        found: dict[str, str | None] = {}
+
+        def on_lookup(request_id: str, response: Any, exception: Exception | None) -> None:
+            if exception is not None:
+                errors.append(exception)
+                return
+            found[request_id] = self._first_item_id(response)
 
-        result = events_api.insert(
-            calendarId=self.calendar_id,
-            body=payload,
-            sendUpdates="none",
-        ).execute()
-        return str(result["id"])
+        def on_write(request_id: str, response: Any, exception: Exception | None) -> None:
+            if exception is not None:
+                errors.append(exception)
+                return
+            on_upserted(sources[int(request_id)], str(response["id"]))
+
+        for offset in range(0, len(sources), GOOGLE_BATCH_LIMIT):
+            indices = range(offset, min(offset + GOOGLE_BATCH_LIMIT, len(sources)))
+            lookup_batch = service.new_batch_http_request(callback=on_lookup)
+            for index in indices:
+                lookup_batch.add(
+                    self._mirror_lookup_request(sources[index].source_id), request_id=str(index)
+                )
+            lookup_batch.execute()
+
+            write_batch = service.new_batch_http_request(callback=on_write)
+            for index in indices:
+                key = str(index)
+                # A failed lookup could hide an existing mirror; skip rather than duplicate it.
+                if key not in found:
+                    continue
+                write_batch.add(
+                    self._mirror_write_request(sources[index], found[key]), request_id=key
+                )
+            write_batch.execute()
+
+        if errors:
+            raise errors[0]
 
     def delete_event(self, google_event_id: str) -> None:
         try:
-            (
-                self._service_handle()
-                .events()
-                .delete(
-                    calendarId=self.calendar_id,
-                    eventId=google_event_id,
-                    sendUpdates="none",
-                )
-                .execute()
-            )
+            self._delete_request(google_event_id).execute()
         except Exception as exc:
-            if google_errors is None or not isinstance(exc, google_errors.HttpError):
+            if not self._is_already_gone(exc):
                 raise
-            if getattr(exc, "status_code", None) == 404:
-                return
-            response = getattr(exc, "resp", None)
-            if response is not None and getattr(response, "status", None) == 404:
-                return
-            raise
+
+    def delete_events(self, google_event_ids: Sequence[str]) -> set[str]:
+        """Delete many events with batched HTTP calls and return the ids that are now gone.
+
+        Events that were already deleted count as gone. Ids missing from the result failed
+        and are logged; callers keep their state so the next pass retries them.
+        """
+        gone: set[str] = set()
+        # Several mapping rows can point at one event; BatchHttpRequest rejects repeated ids.
+        unique_ids = list(dict.fromkeys(google_event_ids))
+        if not unique_ids:
+            return gone
+        service = self._service_handle()
+
+        def on_delete(request_id: str, _response: Any, exception: Exception | None) -> None:
+            if exception is None or self._is_already_gone(exception):
+                gone.add(request_id)
+            else:
+                logger.warning("Google delete failed event_id=%s: %s", request_id, exception)
+
+        for offset in range(0, len(unique_ids), GOOGLE_BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=on_delete)
+            for google_event_id in unique_ids[offset : offset + GOOGLE_BATCH_LIMIT]:
+                batch.add(self._delete_request(google_event_id), request_id=google_event_id)
+            try:
+                batch.execute()
+            except Exception:
+                logger.warning("Google delete batch failed", exc_info=True)
+        return gone
 
     def health_check(self) -> None:
         self._service_handle().calendars().get(calendarId=self.calendar_id).execute()
@@ -370,8 +422,8 @@ class GoogleClient:
         normalized = value.astimezone(UTC) if value.tzinfo else value.replace(tzinfo=UTC)
         return normalized.isoformat().replace("+00:00", "Z")
 
-    def _find_outlook_mirror(self, outlook_id: str) -> str | None:
-        response = (
+    def _mirror_lookup_request(self, outlook_id: str) -> Any:
+        return (
             self._service_handle()
             .events()
             .list(
@@ -383,14 +435,51 @@ class GoogleClient:
                     f"{MARKER_OUTLOOK_ID_KEY}={outlook_id}",
                 ],
             )
-            .execute()
         )
+
+    def _first_item_id(self, response: dict[str, Any]) -> str | None:
         items = response.get("items", [])
         if not items:
             return None
         event_id = items[0].get("id")
         return str(event_id) if event_id else None
 
+    def _mirror_write_request(self, source: CanonicalEvent, mirror_id: str | None) -> Any:
+        payload = self._mirror_payload(source)
+        events_api = self._service_handle().events()
+        if mirror_id:
+            return events_api.patch(
+                calendarId=self.calendar_id,
+                eventId=mirror_id,
+                body=payload,
+                sendUpdates="none",
+            )
+        return events_api.insert(
+            calendarId=self.calendar_id,
+            body=payload,
+            sendUpdates="none",
+        )
+
+    def _delete_request(self, google_event_id: str) -> Any:
+        return (
+            self._service_handle()
+            .events()
+            .delete(
+                calendarId=self.calendar_id,
+                eventId=google_event_id,
+                sendUpdates="none",
+            )
+        )
+
+    def _is_already_gone(self, exc: Exception) -> bool:
+        # Deleting an event that was already deleted answers 410 Gone rather than 404.
+        if google_errors is None or not isinstance(exc, google_errors.HttpError):
+            return False
+        if getattr(exc, "status_code", None) in GOOGLE_GONE_STATUSES:
+            return True
+        response = getattr(exc, "resp", None)
+        return response is not None and getattr(response, "status", None) in GOOGLE_GONE_STATUSES
+
     def _mirror_payload(self, source: CanonicalEvent) -> dict[str, Any]:
         body: dict[str, Any] = {
             "summary": source.summary,
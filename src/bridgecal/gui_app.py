@@ -1,18 +1,29 @@
 from __future__ import annotations
 
-import json
+import codecs
 import os
-import shlex
+import re
 import sys
+import time
+from collections import deque
 from collections.abc import Callable
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import cache, partial
 from pathlib import Path
-from queue import Empty, SimpleQueue
-from threading import Event
-from typing import TYPE_CHECKING, Any
-
-from PyQt6.QtCore import QObject, QProcess, QThread, QTimer, QUrl, pyqtSignal, pyqtSlot
-from PyQt6.QtGui import QDesktopServices, QTextCursor
+from threading import Event, Lock
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from PyQt6.QtCore import (
+    QObject,
+    QProcess,
+    QTimer,
+    QUrl,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt6.QtGui import QCloseEvent, QDesktopServices, QTextCursor
 from PyQt6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -45,7 +56,9 @@ from .windows_scheduler import (
 )
 
 if TYPE_CHECKING:
-    from .availability import AvailabilityConflict, AvailabilityResult
+    from .availability import AvailabilityConflict, AvailabilityResult, QueryTimeRange
+    from .google_client import GoogleClient
+    from .outlook_client import OutlookClient
 
 WINDOW_TITLE = "かんたん予定確認・同期"
 LANG_JA = "ja"
@@ -55,6 +68,38 @@ AVAILABILITY_MODEL_IDS: tuple[str, str] = (
     "Qwen/Qwen3-1.7B",
 )
 AVAILABILITY_MAX_NEW_TOKENS = 16_384
+ACTIVITY_LOG_MAX_BLOCKS = 5_000
+LLM_LOG_MAX_BLOCKS = 2_000
+LLM_LOG_FLUSH_INTERVAL_MS = 50
+BACKGROUND_MAX_WORKERS = 4
+SYNC_PROGRESS_LINE_PATTERN = re.compile(r"^[ \t]*(sync_progress:|sync:)[^\n]*", re.MULTILINE)
+CONFIG_EXISTS_CACHE_SECONDS = 2.0
+CLIENT_SECRET_REQUIRED_FIELDS = (
+    "client_id",
+    "client_secret",
+    "auth_uri",
+    "token_uri",
+    "redirect_uris",
+)
+LOCAL_REDIRECT_PREFIXES = ("http://localhost", "http://127.0.0.1")
+TOML_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+SETUP_CONFIG_TOML_TEMPLATE = """\
+data_dir = "{data_dir}"
+
+[outlook]
+past_days = 30
+future_days = 180
+
+[google]
+calendar_id = "{calendar_id}"
+client_secret_path = "google_client_secret.json"
+token_path = "google_token.json"
+insecure_tls_skip_verify = {insecure_tls_skip_verify}
+
+[sync]
+interval_seconds = {interval_seconds}
+redaction_mode = "none"
+"""
 
 TRANSLATIONS: dict[str, dict[str, str]] = {
     LANG_JA: {
@@ -140,6 +185,7 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
         "log_status_refresh_fail": "自動同期の状態更新に失敗しました: {error}",
         "log_done_success": "正常に完了しました。",
         "log_done_error": "エラーで終了しました。終了コード: {exit_code}",
+        "log_availability_cancelled": "画面を閉じたため空き時間チェックを中止しました。",
         "log_process_failure": "プロセスエラー: {error}",
         "action_manual_sync": "手動同期",
         "action_doctor_check": "接続チェック",
@@ -295,6 +341,7 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
         "log_status_refresh_fail": "Failed to refresh Auto Sync status: {error}",
         "log_done_success": "Completed successfully.",
         "log_done_error": "Completed with errors. Exit code: {exit_code}",
+        "log_availability_cancelled": "Availability check cancelled because the dialog was closed.",
         "log_process_failure": "Process failure: {error}",
         "action_manual_sync": "Manual sync",
         "action_doctor_check": "Doctor check",
@@ -456,33 +503,112 @@ QProgressBar::chunk {
 """
 
 
-class _BackgroundWorker(QObject):
-    finished = pyqtSignal(object)
-    failed = pyqtSignal(str)
+BADGE_STYLES: dict[str, str] = {
+    "good": (
+        "QLabel { background: #d1fae5; color: #065f46; border: 2px solid #10b981; "
+        "border-radius: 8px; padding: 6px 10px; font-size: 18px; font-weight: 700; }"
+    ),
+    "busy": (
+        "QLabel { background: #dbeafe; color: #1e3a8a; border: 2px solid #2563eb; "
+        "border-radius: 8px; padding: 6px 10px; font-size: 18px; font-weight: 700; }"
+    ),
+    "bad": (
+        "QLabel { background: #fee2e2; color: #7f1d1d; border: 2px solid #ef4444; "
+        "border-radius: 8px; padding: 6px 10px; font-size: 18px; font-weight: 700; }"
+    ),
+    "neutral": (
+        "QLabel { background: #e2e8f0; color: #1e293b; border: 2px solid #94a3b8; "
+        "border-radius: 8px; padding: 6px 10px; font-size: 18px; font-weight: 700; }"
+    ),
+}
 
-    def __init__(self, operation: Callable[[], object]) -> None:
-        super().__init__()
-        self._operation = operation
 
-    @pyqtSlot()
-    def run(self) -> None:
-        try:
-            result = self._operation()
-        except Exception as exc:  # pragma: no cover - defensive guard
-            self.failed.emit(str(exc))
+class _BackgroundResultRelay(QObject):
+    """Carries finished futures from executor threads back to the GUI thread."""
+
+    delivered = pyqtSignal(object)
+
+
+@dataclass(slots=True)
+class _AvailabilityPopupState:
+    busy: bool = False
+    voice_running: bool = False
+    voice_stop_requested: bool = False
+    voice_stop_event: Event | None = None
+    check_cancel_event: Event | None = None
+    llm_streaming: bool = False
+
+
+class _AvailabilityRuntime(NamedTuple):
+    availability_result: type[AvailabilityResult]
+    check_availability: Callable[..., AvailabilityResult]
+    parse_natural_time_range: Callable[..., QueryTimeRange]
+    google_client: type[GoogleClient]
+    outlook_client: type[OutlookClient]
+
+
+@cache
+def _availability_runtime() -> _AvailabilityRuntime:
+    # Kept off the startup path (torch/transformers load here), but resolved only once.
+    from .availability import AvailabilityResult, check_availability, parse_natural_time_range
+    from .google_client import GoogleClient
+    from .outlook_client import OutlookClient
+
+    return _AvailabilityRuntime(
+        availability_result=AvailabilityResult,
+        check_availability=check_availability,
+        parse_natural_time_range=parse_natural_time_range,
+        google_client=GoogleClient,
+        outlook_client=OutlookClient,
+    )
+
+
+class _LlmStreamRelay(QObject):
+    """Buffers streamed parser output from the availability worker for the GUI thread."""
+
+    pending = pyqtSignal()
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._lock = Lock()
+        self._chunks: deque[str] = deque()
+
+    def push(self, chunk: str) -> None:
+        if not chunk:
             return
-        self.finished.emit(result)
+        with self._lock:
+            was_empty = not self._chunks
+            self._chunks.append(chunk)
+        # Only the first chunk of a batch wakes the GUI thread; the rest ride along.
+        if was_empty:
+            self.pending.emit()
+
+    def take(self) -> deque[str]:
+        with self._lock:
+            chunks, self._chunks = self._chunks, deque()
+        return chunks
 
 
 class BridgeCalWindow(QWidget):
     def __init__(self, config_path: Path | None = None) -> None:
         super().__init__()
         self._process: QProcess | None = None
+        self._active_language = LANG_JA
+        self._active_translations: dict[str, str] = TRANSLATIONS[LANG_JA]
+        self._process_decoders: dict[QProcess.ProcessChannel, codecs.IncrementalDecoder] = {}
+        self._process_pending_text: dict[QProcess.ProcessChannel, str] = {}
         self._active_action_key: str | None = None
-        self._background_thread: QThread | None = None
-        self._background_worker: _BackgroundWorker | None = None
-        self._background_on_success: Callable[[object], None] | None = None
-        self._background_on_failure: Callable[[str], None] | None = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=BACKGROUND_MAX_WORKERS,
+            thread_name_prefix="bridgecal-bg",
+        )
+        self._background_callbacks: dict[
+            Future[object], tuple[Callable[[object], None], Callable[[str], None]]
+        ] = {}
+        self._background_relay = _BackgroundResultRelay(self)
+        # The relay lives on the GUI thread, so AutoConnection queues worker-thread emits.
+        self._background_relay.delivered.connect(self._deliver_background_result)
+        self._scheduler_status_query_running = False
         self._status_timer = QTimer(self)
         self._last_scheduler_status: str | None = None
         self._scheduler_status_loading = False
@@ -493,6 +619,14 @@ class BridgeCalWindow(QWidget):
         self._sync_progress_stage: str | None = None
         self._sync_progress_outlook: int | None = None
         self._sync_progress_google: int | None = None
+        self._last_sync_progress_step: tuple[int | None, int | None, str | None] = (
+            None,
+            None,
+            None,
+        )
+        self._cached_config_path: Path | None = None
+        self._config_exists_confirmed_at: tuple[Path, float] | None = None
+        self._google_client_cache: tuple[tuple[str, Path, Path, bool], GoogleClient] | None = None
         self._setup_prompt_shown = False
         self._config_status_key = "status_config_unknown"
         self._config_status_tone = "neutral"
@@ -539,6 +673,9 @@ class BridgeCalWindow(QWidget):
         self.sync_progress_bar.setFormat("0%")
         self.output = QPlainTextEdit()
         self.output.setReadOnly(True)
+        # Long sync runs stream thousands of lines; cap the log so old blocks are dropped.
+        self.output.setMaximumBlockCount(ACTIVITY_LOG_MAX_BLOCKS)
+        self.output.setUndoRedoEnabled(False)
 
         self.setup_assistant_button = QPushButton("0. First-time Setup")
         self.doctor_button = QPushButton("1. Check Connection")
@@ -567,34 +704,25 @@ class BridgeCalWindow(QWidget):
         self._refresh_config_values(log_errors=False)
         QTimer.singleShot(350, self._offer_setup_assistant_if_needed)
 
-        self._status_timer.timeout.connect(
-            lambda: self._refresh_scheduler_status(
-                emit_log=False,
-                interactive=False,
-                show_loading=False,
-            )
-        )
+        self._status_timer.timeout.connect(self._refresh_scheduler_status_silently)
         self._status_timer.start(10_000)
         # Defer first scheduler query so window paints quickly on startup.
-        QTimer.singleShot(
-            150,
-            lambda: self._refresh_scheduler_status(
-                emit_log=False,
-                interactive=False,
-                show_loading=False,
-            ),
-        )
+        QTimer.singleShot(150, self._refresh_scheduler_status_silently)
 
     def _language(self) -> str:
+        return self._active_language
+
+    def _sync_active_language(self) -> None:
         value = self.language_selector.currentData()
-        if isinstance(value, str) and value in TRANSLATIONS:
-            return value
-        return LANG_JA
+        language = value if isinstance(value, str) and value in TRANSLATIONS else LANG_JA
+        self._active_language = language
+        self._active_translations = TRANSLATIONS[language]
 
     def _t(self, key: str, **kwargs: object) -> str:
-        catalog = TRANSLATIONS.get(self._language(), TRANSLATIONS[LANG_JA])
-        text = catalog.get(key, key)
-        return text.format(**kwargs)
+        return self._template(key).format(**kwargs)
+
+    def _template(self, key: str) -> str:
+        return self._active_translations.get(key, key)
 
     def _initial_availability_model_id(self) -> str:
         env_value = os.environ.get("BRIDGECAL_LFM25_LOCAL_MODEL", "").strip()
@@ -602,7 +730,19 @@ class BridgeCalWindow(QWidget):
             return env_value
         return AVAILABILITY_MODEL_IDS[0]
 
+    def _refresh_static_texts(self) -> None:
+        # Fixed strings used on hot paths; re-resolved only when the language changes.
+        self._text_action_idle = self._t("status_action_idle")
+        self._text_another_running = self._t("log_another_running")
+        self._text_sync_idle = self._t("sync_progress_idle")
+        self._text_sync_running = self._t("sync_progress_running")
+        self._text_sync_done = self._t("sync_progress_done")
+        self._text_sync_failed = self._t("sync_progress_failed")
+
     def _apply_language(self) -> None:
+        # The selector is read once here; _t and _language use the cached catalog.
+        self._sync_active_language()
+        self._refresh_static_texts()
         self.setWindowTitle(self._t("window_title"))
         self.title_label.setText(self._t("title_text"))
         self.hint_label.setText(self._t("hint_text"))
@@ -689,6 +829,7 @@ class BridgeCalWindow(QWidget):
         self.open_data_dir_button.clicked.connect(self._open_data_dir)
         self.settings_button.clicked.connect(self._open_settings)
         self.language_selector.currentIndexChanged.connect(self._on_language_changed)
+        self.config_path_input.textChanged.connect(self._on_config_path_changed)
 
     def _append_output(self, message: str) -> None:
         text = message.rstrip()
@@ -701,7 +842,7 @@ class BridgeCalWindow(QWidget):
 
     def _update_action_status_badge(self) -> None:
         if self._active_action_key is None:
-            self._set_badge(self.action_status, self._t("status_action_idle"), tone="neutral")
+            self._set_badge(self.action_status, self._text_action_idle, tone="neutral")
             return
         self._set_badge(
             self.action_status,
@@ -716,7 +857,7 @@ class BridgeCalWindow(QWidget):
 
     def _refresh_sync_progress_label(self) -> None:
         if self._sync_progress_state == "idle":
-            self.sync_progress_status.setText(self._t("sync_progress_idle"))
+            self._set_badge_text(self.sync_progress_status, self._text_sync_idle)
             return
         if self._sync_progress_state == "running":
             if (
@@ -724,33 +865,36 @@ class BridgeCalWindow(QWidget):
                 and self._sync_progress_total_count is not None
                 and self._sync_progress_stage is not None
             ):
-                self.sync_progress_status.setText(
+                self._set_badge_text(
+                    self.sync_progress_status,
                     self._t(
                         "sync_progress_step",
                         stage=self._sync_stage_label(self._sync_progress_stage),
                         done=self._sync_progress_done_count,
                         total=self._sync_progress_total_count,
-                    )
+                    ),
                 )
                 return
-            self.sync_progress_status.setText(self._t("sync_progress_running"))
+            self._set_badge_text(self.sync_progress_status, self._text_sync_running)
             return
         if self._sync_progress_state == "done":
             if self._sync_progress_outlook is not None and self._sync_progress_google is not None:
-                self.sync_progress_status.setText(
+                self._set_badge_text(
+                    self.sync_progress_status,
                     self._t(
                         "sync_progress_summary",
                         outlook=self._sync_progress_outlook,
                         google=self._sync_progress_google,
-                    )
+                    ),
                 )
                 return
-            self.sync_progress_status.setText(self._t("sync_progress_done"))
+            self._set_badge_text(self.sync_progress_status, self._text_sync_done)
             return
         if self._sync_progress_state == "failed":
-            self.sync_progress_status.setText(self._t("sync_progress_failed"))
+            self._set_badge_text(self.sync_progress_status, self._text_sync_failed)
 
     def _set_sync_progress_running(self) -> None:
+        self._last_sync_progress_step = (None, None, None)
         self._set_sync_progress_visible(True)
         self._sync_progress_state = "running"
         self._sync_progress_done_count = None
@@ -772,6 +916,11 @@ class BridgeCalWindow(QWidget):
     def _set_sync_progress_step(self, *, done: int, total: int, stage: str) -> None:
         safe_total = max(total, 1)
         safe_done = max(0, min(done, safe_total))
+        # The sync subprocess re-emits stage markers; skip repaints for identical steps.
+        step = (safe_done, safe_total, stage)
+        if step == self._last_sync_progress_step:
+            return
+        self._last_sync_progress_step = step
         percent = int((safe_done * 100) / safe_total)
 
         self._set_sync_progress_visible(True)
@@ -788,6 +937,7 @@ class BridgeCalWindow(QWidget):
     def _set_sync_progress_done(
         self, *, outlook: int | None = None, google: int | None = None
     ) -> None:
+        self._last_sync_progress_step = (None, None, None)
         self._sync_progress_state = "done"
         self._sync_progress_done_count = None
         self._sync_progress_total_count = None
@@ -800,6 +950,7 @@ class BridgeCalWindow(QWidget):
         self._refresh_sync_progress_label()
 
     def _set_sync_progress_failed(self) -> None:
+        self._last_sync_progress_step = (None, None, None)
         self._sync_progress_state = "failed"
         self._sync_progress_done_count = None
         self._sync_progress_total_count = None
@@ -859,7 +1010,7 @@ class BridgeCalWindow(QWidget):
 
     def _begin_action(self, action_key: str) -> bool:
         if self._active_action_key is not None:
-            self._append_output(self._t("log_another_running"))
+            self._append_output(self._text_another_running)
             return False
         self._active_action_key = action_key
         self._set_command_buttons_enabled(False)
@@ -881,50 +1032,52 @@ class BridgeCalWindow(QWidget):
         on_success: Callable[[object], None],
         on_failure: Callable[[str], None],
     ) -> bool:
-        if self._background_thread is not None:
+        try:
+            future = self._executor.submit(operation)
+        except RuntimeError:
+            # The executor is shut down once the window starts closing.
             return False
-
-        thread = QThread(self)
-        worker = _BackgroundWorker(operation)
-        worker.moveToThread(thread)
-
-        thread.started.connect(worker.run)
-        worker.finished.connect(self._on_background_success)
-        worker.failed.connect(self._on_background_failure)
-        worker.finished.connect(thread.quit)
-        worker.failed.connect(thread.quit)
-        thread.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
-
-        self._background_thread = thread
-        self._background_worker = worker
-        self._background_on_success = on_success
-        self._background_on_failure = on_failure
-        thread.start()
+        self._background_callbacks[future] = (on_success, on_failure)
+        future.add_done_callback(self._background_relay.delivered.emit)
         return True
 
-    def _clear_background_refs(self) -> None:
-        self._background_thread = None
-        self._background_worker = None
-        self._background_on_success = None
-        self._background_on_failure = None
+    def _has_background_operations(self) -> bool:
+        return bool(self._background_callbacks)
+
+    @pyqtSlot(object)
+    def _deliver_background_result(self, future: Future[object]) -> None:
+        # A future that is already done runs add_done_callback inline, so this slot can be
+        # reached before _start_background_operation returns; defer so callers set state first.
+        QTimer.singleShot(0, partial(self._run_background_callbacks, future))
 
-    def _on_background_success(self, result: object) -> None:
-        callback = self._background_on_success
-        self._clear_background_refs()
-        if callback is not None:
-            callback(result)
+    def _run_background_callbacks(self, future: Future[object]) -> None:
+        callbacks = self._background_callbacks.pop(future, None)
+        if callbacks is None or future.cancelled():
+            return
+        on_success, on_failure = callbacks
+        error = future.exception()
+        if error is not None:
+            on_failure(str(error))
+            return
+        on_success(future.result())
 
-    def _on_background_failure(self, error: str) -> None:
-        callback = self._background_on_failure
-        self._clear_background_refs()
-        if callback is not None:
-            callback(error)
+    def closeEvent(self, event: QCloseEvent | None) -> None:
+        self._status_timer.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        super().closeEvent(event)
 
     def _current_config_path(self) -> Path:
-        return Path(self.config_path_input.text().strip()).expanduser()
+        if self._cached_config_path is None:
+            self._cached_config_path = Path(self.config_path_input.text().strip()).expanduser()
+        return self._cached_config_path
+
+    def _on_config_path_changed(self, _text: str) -> None:
+        self._cached_config_path = None
+        self._config_exists_confirmed_at = None
+        self._google_client_cache = None
 
     def _refresh_config_values(self, *, log_errors: bool) -> None:
+        self._google_client_cache = None
         config_path = self._current_config_path()
         if not config_path.exists():
             self._set_config_status("status_config_missing", tone="bad")
@@ -949,28 +1102,19 @@ class BridgeCalWindow(QWidget):
         self._set_badge(self.config_status, self._t(status_key), tone=tone)
 
     def _set_badge(self, label: QLabel, text: str, *, tone: str) -> None:
-        if tone == "good":
-            style = (
-                "QLabel { background: #d1fae5; color: #065f46; border: 2px solid #10b981; "
-                "border-radius: 8px; padding: 6px 10px; font-size: 18px; font-weight: 700; }"
-            )
-        elif tone == "busy":
-            style = (
-                "QLabel { background: #dbeafe; color: #1e3a8a; border: 2px solid #2563eb; "
-                "border-radius: 8px; padding: 6px 10px; font-size: 18px; font-weight: 700; }"
-            )
-        elif tone == "bad":
-            style = (
-                "QLabel { background: #fee2e2; color: #7f1d1d; border: 2px solid #ef4444; "
-                "border-radius: 8px; padding: 6px 10px; font-size: 18px; font-weight: 700; }"
-            )
-        else:
-            style = (
-                "QLabel { background: #e2e8f0; color: #1e293b; border: 2px solid #94a3b8; "
-                "border-radius: 8px; padding: 6px 10px; font-size: 18px; font-weight: 700; }"
-            )
-        label.setText(text)
-        label.setStyleSheet(style)
+        self._set_badge_tone(label, tone)
+        self._set_badge_text(label, text)
+
+    def _set_badge_text(self, label: QLabel, text: str) -> None:
+        if label.text() != text:
+            label.setText(text)
+
+    def _set_badge_tone(self, label: QLabel, tone: str) -> None:
+        # Stylesheets are re-parsed on every set; only touch them on tone transitions.
+        if label.property("tone") == tone:
+            return
+        label.setStyleSheet(BADGE_STYLES.get(tone, BADGE_STYLES["neutral"]))
+        label.setProperty("tone", tone)
 
     def _set_scheduler_loading(self, loading: bool) -> None:
         self._scheduler_status_loading = loading
@@ -1002,6 +1146,8 @@ class BridgeCalWindow(QWidget):
         QMessageBox.warning(self, self._t("warning_setup_title"), message)
 
     def _parse_client_secret_json(self, path: Path) -> dict[str, Any]:
+        import json
+
         try:
             raw = path.read_bytes()
             text = raw.decode("utf-8-sig")
@@ -1018,8 +1164,7 @@ class BridgeCalWindow(QWidget):
         if not isinstance(installed, dict):
             raise ValueError(self._t("warning_setup_secret_installed"))
 
-        required_fields = ("client_id", "client_secret", "auth_uri", "token_uri", "redirect_uris")
-        missing = [name for name in required_fields if not installed.get(name)]
+        missing = [name for name in CLIENT_SECRET_REQUIRED_FIELDS if not installed.get(name)]
         if missing:
             raise ValueError(
                 self._t(
@@ -1033,15 +1178,13 @@ class BridgeCalWindow(QWidget):
             raise ValueError(self._t("warning_setup_secret_redirect"))
 
         has_local_redirect = any(
-            isinstance(uri, str)
-            and (uri.startswith("http://localhost") or uri.startswith("http://127.0.0.1"))
-            for uri in redirect_uris
+            uri.startswith(LOCAL_REDIRECT_PREFIXES) for uri in redirect_uris if isinstance(uri, str)
         )
         if not has_local_redirect:
             raise ValueError(self._t("warning_setup_secret_redirect"))
 
     def _toml_escape(self, value: str) -> str:
-        return value.replace("\\", "\\\\").replace('"', '\\"')
+        return value.translate(TOML_ESCAPE_TABLE)
 
     def _build_setup_config_toml(
         self,
@@ -1051,26 +1194,17 @@ class BridgeCalWindow(QWidget):
         interval_seconds: int,
         insecure_tls_skip_verify: bool,
     ) -> str:
-        data_dir_literal = self._toml_escape(data_dir.as_posix())
-        calendar_id_literal = self._toml_escape(calendar_id)
-        tls_literal = "true" if insecure_tls_skip_verify else "false"
-        return (
-            f'data_dir = "{data_dir_literal}"\n\n'
-            "[outlook]\n"
-            "past_days = 30\n"
-            "future_days = 180\n\n"
-            "[google]\n"
-            f'calendar_id = "{calendar_id_literal}"\n'
-            'client_secret_path = "google_client_secret.json"\n'
-            'token_path = "google_token.json"\n'
-            f"insecure_tls_skip_verify = {tls_literal}\n\n"
-            "[sync]\n"
-            f"interval_seconds = {interval_seconds}\n"
-            'redaction_mode = "none"\n'
+        return SETUP_CONFIG_TOML_TEMPLATE.format(
+            data_dir=self._toml_escape(data_dir.as_posix()),
+            calendar_id=self._toml_escape(calendar_id),
+            insecure_tls_skip_verify="true" if insecure_tls_skip_verify else "false",
+            interval_seconds=interval_seconds,
         )
 
     def _open_setup_assistant(self) -> None:
-        if self._active_action_key is not None or self._background_thread is not None:
+        import json
+
+        if self._active_action_key is not None or self._has_background_operations():
             self._append_output(self._t("log_another_running"))
             return
 
@@ -1181,45 +1315,56 @@ class BridgeCalWindow(QWidget):
             self._show_setup_error(self._t("warning_setup_secret_missing", path=secret_source_path))
             return
 
-        try:
-            client_secret_payload = self._parse_client_secret_json(secret_source_path)
-            self._validate_desktop_client_secret_json(client_secret_payload)
-        except ValueError as exc:
-            self._show_setup_error(str(exc))
-            return
-
         interval_seconds = int(interval_input.value())
         insecure_tls_skip_verify = insecure_tls_checkbox.isChecked()
         data_dir = config_path.parent
-        data_dir.mkdir(parents=True, exist_ok=True)
-        config_path.parent.mkdir(parents=True, exist_ok=True)
-
-        self._append_output(self._t("log_setup_started"))
-
         destination_secret_path = data_dir / "google_client_secret.json"
-        destination_secret_path.write_text(
-            json.dumps(client_secret_payload, ensure_ascii=False, indent=2) + "\n",
-            encoding="utf-8",
-        )
-        self._append_output(self._t("log_setup_saved_secret", path=destination_secret_path))
-
         config_text = self._build_setup_config_toml(
             data_dir=data_dir,
             calendar_id=calendar_id,
             interval_seconds=interval_seconds,
             insecure_tls_skip_verify=insecure_tls_skip_verify,
         )
-        config_path.write_text(config_text, encoding="utf-8")
+
+        def persist_setup_files() -> None:
+            # Validation errors are ValueErrors whose text reaches _show_setup_error.
+            client_secret_payload = self._parse_client_secret_json(secret_source_path)
+            self._validate_desktop_client_secret_json(client_secret_payload)
+            data_dir.mkdir(parents=True, exist_ok=True)
+            # The copied secret is only read back by the OAuth flow, so skip pretty-printing.
+            destination_secret_path.write_text(
+                json.dumps(client_secret_payload, ensure_ascii=False, separators=(",", ":")) + "\n",
+                encoding="utf-8",
+            )
+            config_path.write_text(config_text, encoding="utf-8")
+
+        self._append_output(self._t("log_setup_started"))
+        started = self._start_background_operation(
+            operation=persist_setup_files,
+            on_success=lambda _result: self._on_setup_files_saved(
+                config_path=config_path,
+                secret_path=destination_secret_path,
+                interval_seconds=interval_seconds,
+            ),
+            on_failure=self._show_setup_error,
+        )
+        if not started:
+            self._append_output(self._t("log_another_running"))
+
+    def _on_setup_files_saved(
+        self,
+        *,
+        config_path: Path,
+        secret_path: Path,
+        interval_seconds: int,
+    ) -> None:
+        self._append_output(self._t("log_setup_saved_secret", path=secret_path))
         self._append_output(self._t("log_setup_saved_config", path=config_path))
 
         self.config_path_input.setText(str(config_path))
         self.interval_input.setValue(interval_seconds)
         self._refresh_config_values(log_errors=True)
-        self._refresh_scheduler_status(
-            emit_log=False,
-            interactive=False,
-            show_loading=False,
-        )
+        self._refresh_scheduler_status_silently()
 
         self._append_output(self._t("log_setup_done"))
         self._run_doctor()
@@ -1293,11 +1438,7 @@ class BridgeCalWindow(QWidget):
             self.config_path_input.setText(new_path)
         self.interval_input.setValue(int(interval_input.value()))
         self._refresh_config_values(log_errors=True)
-        self._refresh_scheduler_status(
-            emit_log=False,
-            interactive=False,
-            show_loading=False,
-        )
+        self._refresh_scheduler_status_silently()
 
     def _set_command_buttons_enabled(self, enabled: bool) -> None:
         self.setup_assistant_button.setEnabled(enabled)
@@ -1311,6 +1452,8 @@ class BridgeCalWindow(QWidget):
         self.open_data_dir_button.setEnabled(enabled)
 
     def _start_bridgecal_command(self, args: list[str], *, action_key: str) -> None:
+        import shlex
+
         if self._process is not None and self._process.state() != QProcess.ProcessState.NotRunning:
             self._finish_action()
             self._append_output(self._t("log_another_running"))
@@ -1325,6 +1468,7 @@ class BridgeCalWindow(QWidget):
         process.errorOccurred.connect(self._on_process_error)
 
         self._process = process
+        self._reset_process_decoders()
         action_label = self._action_label(action_key)
         quoted = " ".join(shlex.quote(arg) for arg in args)
         self._append_output(self._t("log_starting", action=action_label))
@@ -1334,33 +1478,56 @@ class BridgeCalWindow(QWidget):
         process.start()
 
     def _read_process_stdout(self) -> None:
-        if self._process is None:
-            return
-        text = bytes(self._process.readAllStandardOutput()).decode(  # type: ignore[call-overload]
-            "utf-8", errors="replace"
-        )
-        if self._active_action_key == "action_manual_sync":
-            for line in text.splitlines():
-                if self._try_apply_sync_step_progress(line):
-                    continue
-                self._try_apply_sync_summary_progress(line)
-        self._append_output(text)
+        self._read_process_lines(QProcess.ProcessChannel.StandardOutput)
 
     def _read_process_stderr(self) -> None:
-        if self._process is None:
+        self._read_process_lines(QProcess.ProcessChannel.StandardError)
+
+    def _reset_process_decoders(self) -> None:
+        decoder_factory = codecs.getincrementaldecoder("utf-8")
+        self._process_decoders = {
+            QProcess.ProcessChannel.StandardOutput: decoder_factory(errors="replace"),
+            QProcess.ProcessChannel.StandardError: decoder_factory(errors="replace"),
+        }
+        self._process_pending_text = {}
+
+    def _read_process_lines(self, channel: QProcess.ProcessChannel, *, final: bool = False) -> None:
+        process = self._process
+        decoder = self._process_decoders.get(channel)
+        if process is None or decoder is None:
             return
-        text = bytes(self._process.readAllStandardError()).decode(  # type: ignore[call-overload]
-            "utf-8", errors="replace"
-        )
+        if channel == QProcess.ProcessChannel.StandardOutput:
+            raw = process.readAllStandardOutput()
+        else:
+            raw = process.readAllStandardError()
+        # The incremental decoder carries multi-byte sequences split across reads.
+        text = self._process_pending_text.pop(channel, "") + decoder.decode(raw.data(), final=final)
+        if not final:
+            text, newline, pending = text.rpartition("\n")
+            if pending:
+                self._process_pending_text[channel] = pending
+            if not newline:
+                return
+        else:
+            text = text.removesuffix("\n")
+            if not text:
+                return
+
         if self._active_action_key == "action_manual_sync":
-            for line in text.splitlines():
-                if self._try_apply_sync_step_progress(line):
-                    continue
-                self._try_apply_sync_summary_progress(line)
-        self._append_output(text)
+            # One compiled scan per chunk instead of two prefix checks per line.
+            for match in SYNC_PROGRESS_LINE_PATTERN.finditer(text):
+                if match.group(1) == "sync_progress:":
+                    self._try_apply_sync_step_progress(match.group())
+                else:
+                    self._try_apply_sync_summary_progress(match.group())
+        # One append per read keeps the log to a single layout pass per chunk.
+        self._append_output("\n".join(line.rstrip("\r") for line in text.split("\n")))
 
     def _on_process_finished(self, exit_code: int, _status: QProcess.ExitStatus) -> None:
         completed_action = self._active_action_key
+        # Flush any trailing output that did not end with a newline.
+        self._read_process_lines(QProcess.ProcessChannel.StandardOutput, final=True)
+        self._read_process_lines(QProcess.ProcessChannel.StandardError, final=True)
         if exit_code == 0:
             self._append_output(self._t("log_done_success"))
         else:
@@ -1373,11 +1540,7 @@ class BridgeCalWindow(QWidget):
                 self._set_sync_progress_failed()
         self._finish_action()
         self._process = None
-        self._refresh_scheduler_status(
-            emit_log=False,
-            interactive=False,
-            show_loading=False,
-        )
+        self._refresh_scheduler_status_silently()
 
     def _on_process_error(self, error: QProcess.ProcessError) -> None:
         if self._active_action_key == "action_manual_sync":
@@ -1388,8 +1551,19 @@ class BridgeCalWindow(QWidget):
 
     def _ensure_config_exists(self) -> Path | None:
         config_path = self._current_config_path()
+        now = time.monotonic()
+        confirmed = self._config_exists_confirmed_at
+        # Coalesce the stat across rapid-fire button clicks on the same path.
+        if (
+            confirmed is not None
+            and confirmed[0] == config_path
+            and now - confirmed[1] < CONFIG_EXISTS_CACHE_SECONDS
+        ):
+            return config_path
         if config_path.exists():
+            self._config_exists_confirmed_at = (config_path, now)
             return config_path
+        self._config_exists_confirmed_at = None
         QMessageBox.warning(
             self,
             self._t("warning_config_missing_title"),
@@ -1424,7 +1598,7 @@ class BridgeCalWindow(QWidget):
         config_path = self._ensure_config_exists()
         if config_path is None:
             return
-        if self._active_action_key is not None or self._background_thread is not None:
+        if self._active_action_key is not None or self._has_background_operations():
             self._append_output(self._t("log_another_running"))
             return
         self._availability_popup_open = True
@@ -1466,6 +1640,8 @@ class BridgeCalWindow(QWidget):
         llm_log_label = QLabel(self._t("availability_llm_log_label"), dialog)
         llm_log_output = QPlainTextEdit(dialog)
         llm_log_output.setReadOnly(True)
+        llm_log_output.setMaximumBlockCount(LLM_LOG_MAX_BLOCKS)
+        llm_log_output.setUndoRedoEnabled(False)
         llm_log_output.setPlainText(self._t("availability_llm_log_waiting"))
         llm_log_output.setMinimumHeight(150)
 
@@ -1476,62 +1652,70 @@ class BridgeCalWindow(QWidget):
         check_button.setObjectName("primaryAction")
         close_button.setObjectName("secondaryAction")
 
-        popup_state: dict[str, Any] = {
-            "busy": False,
-            "voice_running": False,
-            "voice_stop_requested": False,
-            "voice_stop_event": None,
-            "llm_stream_queue": None,
-            "llm_stream_timer": None,
-        }
-
-        def append_llm_log(chunk: str) -> None:
-            if not chunk:
+        popup_state = _AvailabilityPopupState()
+        llm_flush_timer = QTimer(dialog)
+        llm_flush_timer.setSingleShot(True)
+        llm_stream_relay = _LlmStreamRelay(dialog)
+
+        # The log's scroll bar, document and relay are fixed for the dialog's lifetime;
+        # resolve them once instead of on every flush.
+        llm_scroll_bar = llm_log_output.verticalScrollBar()
+        llm_document = llm_log_output.document()
+        llm_set_updates_enabled = llm_log_output.setUpdatesEnabled
+        take_llm_chunks = llm_stream_relay.take
+        end_of_document = QTextCursor.MoveOperation.End
+
+        def append_llm_log_bulk(text: str) -> None:
+            if not text:
                 return
-            cursor = llm_log_output.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.End)
-            llm_log_output.setTextCursor(cursor)
-            llm_log_output.insertPlainText(chunk)
-            llm_log_output.ensureCursorVisible()
-
-        def drain_llm_log_queue() -> None:
-            stream_queue = popup_state.get("llm_stream_queue")
-            if stream_queue is None:
+            following_tail = (
+                llm_scroll_bar is None or llm_scroll_bar.value() >= llm_scroll_bar.maximum()
+            )
+            # A document cursor appends without moving the visible cursor or selection.
+            cursor = QTextCursor(llm_document)
+            cursor.movePosition(end_of_document)
+            # Hold repaints until the whole batch is in, so a backlog paints once.
+            llm_set_updates_enabled(False)
+            try:
+                cursor.insertText(text)
+                if following_tail and llm_scroll_bar is not None:
+                    llm_scroll_bar.setValue(llm_scroll_bar.maximum())
+            finally:
+                llm_set_updates_enabled(True)
+
+        def flush_llm_log() -> None:
+            # Token-level streams arrive in bursts; insert them as one edit per flush.
+            append_llm_log_bulk("".join(take_llm_chunks()))
+
+        def on_llm_pending() -> None:
+            if not popup_state.llm_streaming:
+                take_llm_chunks()
                 return
-            while True:
-                try:
-                    chunk = stream_queue.get_nowait()
-                except Empty:
-                    break
-                if isinstance(chunk, str):
-                    append_llm_log(chunk)
+            if not llm_flush_timer.isActive():
+                llm_flush_timer.start(LLM_LOG_FLUSH_INTERVAL_MS)
 
         def stop_llm_log_stream() -> None:
-            stream_timer = popup_state.get("llm_stream_timer")
-            if isinstance(stream_timer, QTimer):
-                stream_timer.stop()
-            drain_llm_log_queue()
-            popup_state["llm_stream_queue"] = None
-            popup_state["llm_stream_timer"] = None
-
-        def start_llm_log_stream() -> SimpleQueue[str]:
+            llm_flush_timer.stop()
+            flush_llm_log()
+            popup_state.llm_streaming = False
+
+        def start_llm_log_stream() -> Callable[[str], None]:
             stop_llm_log_stream()
             llm_log_output.setPlainText("")
-            stream_queue: SimpleQueue[str] = SimpleQueue()
-            stream_timer = QTimer(dialog)
-            stream_timer.timeout.connect(drain_llm_log_queue)
-            stream_timer.start(40)
-            popup_state["llm_stream_queue"] = stream_queue
-            popup_state["llm_stream_timer"] = stream_timer
-            return stream_queue
+            popup_state.llm_streaming = True
+            return llm_stream_relay.push
+
+        llm_flush_timer.timeout.connect(flush_llm_log)
+        # The relay is parented to the dialog, so worker-thread emits are queued automatically.
+        llm_stream_relay.pending.connect(on_llm_pending)
 
         def refresh_voice_button() -> None:
-            if popup_state["voice_running"]:
+            if popup_state.voice_running:
                 voice_button.setText(self._t("availability_voice_button_stop"))
-                voice_button.setEnabled(not popup_state["voice_stop_requested"])
+                voice_button.setEnabled(not popup_state.voice_stop_requested)
             else:
                 voice_button.setText(self._t("availability_voice_button"))
-                voice_button.setEnabled(not popup_state["busy"])
+                voice_button.setEnabled(not popup_state.busy)
 
         def set_popup_busy(
             *,
@@ -1539,12 +1723,13 @@ class BridgeCalWindow(QWidget):
             status_text: str,
             status_tone: str,
             show_indicator: bool,
+            cancellable: bool = False,
         ) -> None:
-            popup_state["busy"] = busy
+            popup_state.busy = busy
             input_line.setEnabled(not busy)
             model_selector.setEnabled(not busy)
             check_button.setEnabled(not busy)
-            close_button.setEnabled(not busy)
+            close_button.setEnabled(not busy or cancellable)
             self._set_badge(status_label, status_text, tone=status_tone)
             busy_indicator.setVisible(show_indicator)
             refresh_voice_button()
@@ -1555,19 +1740,19 @@ class BridgeCalWindow(QWidget):
             stop_event: Event | None = None,
             stop_requested: bool = False,
         ) -> None:
-            popup_state["voice_running"] = running
-            popup_state["voice_stop_requested"] = stop_requested
-            popup_state["voice_stop_event"] = stop_event
+            popup_state.voice_running = running
+            popup_state.voice_stop_requested = stop_requested
+            popup_state.voice_stop_event = stop_event
             refresh_voice_button()
 
         def request_voice_stop() -> None:
-            if not popup_state["voice_running"] or popup_state["voice_stop_requested"]:
+            if not popup_state.voice_running or popup_state.voice_stop_requested:
                 return
-            stop_event = popup_state["voice_stop_event"]
+            stop_event = popup_state.voice_stop_event
             if stop_event is None:
                 return
             stop_event.set()
-            popup_state["voice_stop_requested"] = True
+            popup_state.voice_stop_requested = True
             self._set_badge(
                 status_label,
                 self._t("availability_status_stopping"),
@@ -1575,69 +1760,53 @@ class BridgeCalWindow(QWidget):
             )
             refresh_voice_button()
 
-        def on_voice_success(result: object) -> None:
-            set_voice_state(running=False)
-            if not isinstance(result, str):
-                self._finish_action()
-                set_popup_busy(
-                    busy=False,
-                    status_text=self._t("availability_status_error"),
-                    status_tone="bad",
-                    show_indicator=False,
-                )
-                QMessageBox.warning(
-                    dialog,
-                    self._t("warning_availability_title"),
-                    self._t(
-                        "warning_availability_voice_error",
-                        error="Unexpected voice transcription result type.",
-                    ),
-                )
-                return
-
-            transcript = result.strip()
-            if transcript:
-                input_line.setText(transcript)
-                set_popup_busy(
-                    busy=False,
-                    status_text=self._t("availability_status_ready"),
-                    status_tone="good",
-                    show_indicator=False,
-                )
-            else:
-                set_popup_busy(
-                    busy=False,
-                    status_text=self._t("availability_status_error"),
-                    status_tone="bad",
-                    show_indicator=False,
-                )
-                QMessageBox.warning(
-                    dialog,
-                    self._t("warning_availability_title"),
-                    self._t("warning_availability_voice_error", error="No speech recognized."),
-                )
-            self._finish_action()
-
-        def on_voice_failure(error: str) -> None:
-            set_voice_state(running=False)
-            self._finish_action()
+        def show_popup_error() -> None:
             set_popup_busy(
                 busy=False,
                 status_text=self._t("availability_status_error"),
                 status_tone="bad",
                 show_indicator=False,
             )
+
+        def fail_popup(warning_key: str, error: str) -> None:
+            self._finish_action()
+            show_popup_error()
             QMessageBox.warning(
                 dialog,
                 self._t("warning_availability_title"),
-                self._t("warning_availability_voice_error", error=error),
+                self._t(warning_key, error=error),
+            )
+
+        def on_voice_success(result: object) -> None:
+            set_voice_state(running=False)
+            if not isinstance(result, str):
+                fail_popup(
+                    "warning_availability_voice_error",
+                    "Unexpected voice transcription result type.",
+                )
+                return
+
+            if not result or result.isspace():
+                fail_popup("warning_availability_voice_error", "No speech recognized.")
+                return
+            input_line.setText(result.strip())
+            set_popup_busy(
+                busy=False,
+                status_text=self._t("availability_status_ready"),
+                status_tone="good",
+                show_indicator=False,
             )
+            self._finish_action()
+
+        def on_voice_failure(error: str) -> None:
+            set_voice_state(running=False)
+            fail_popup("warning_availability_voice_error", error)
 
         def start_voice_input() -> None:
-            if popup_state["voice_running"]:
+            if popup_state.voice_running:
                 request_voice_stop()
                 return
-            if popup_state["busy"]:
+            if popup_state.busy:
                 return
             if not self._begin_action("action_voice_input"):
                 return
@@ -1661,34 +1830,16 @@ class BridgeCalWindow(QWidget):
             if started:
                 return
             set_voice_state(running=False)
-            set_popup_busy(
-                busy=False,
-                status_text=self._t("availability_status_error"),
-                status_tone="bad",
-                show_indicator=False,
-            )
+            show_popup_error()
             self._finish_action()
             self._append_output(self._t("log_another_running"))
 
         def on_check_success(result: object) -> None:
-            from .availability import AvailabilityResult
-
             stop_llm_log_stream()
-            if not isinstance(result, AvailabilityResult):
-                self._finish_action()
-                set_popup_busy(
-                    busy=False,
-                    status_text=self._t("availability_status_error"),
-                    status_tone="bad",
-                    show_indicator=False,
-                )
-                QMessageBox.warning(
-                    dialog,
-                    self._t("warning_availability_title"),
-                    self._t(
-                        "warning_availability_check_error",
-                        error="Unexpected availability result type.",
-                    ),
+            popup_state.check_cancel_event = None
+            if not isinstance(result, _availability_runtime().availability_result):
+                fail_popup(
+                    "warning_availability_check_error", "Unexpected availability result type."
                 )
                 return
 
@@ -1712,21 +1863,22 @@ class BridgeCalWindow(QWidget):
 
         def on_check_failure(error: str) -> None:
             stop_llm_log_stream()
-            self._finish_action()
-            set_popup_busy(
-                busy=False,
-                status_text=self._t("availability_status_error"),
-                status_tone="bad",
-                show_indicator=False,
-            )
-            QMessageBox.warning(
-                dialog,
-                self._t("warning_availability_title"),
-                self._t("warning_availability_check_error", error=error),
-            )
+            cancel_event = popup_state.check_cancel_event
+            popup_state.check_cancel_event = None
+            if cancel_event is not None and cancel_event.is_set():
+                self._finish_action()
+                set_popup_busy(
+                    busy=False,
+                    status_text=self._t("availability_status_ready"),
+                    status_tone="neutral",
+                    show_indicator=False,
+                )
+                self._append_output(self._t("log_availability_cancelled"))
+                return
+            fail_popup("warning_availability_check_error", error)
 
         def start_availability_check() -> None:
-            if popup_state["busy"]:
+            if popup_state.busy:
                 return
             query_text = input_line.text().strip()
             if not query_text:
@@ -1745,12 +1897,15 @@ class BridgeCalWindow(QWidget):
                 else AVAILABILITY_MODEL_IDS[0]
             )
             self._availability_model_id = model_id
-            stream_queue = start_llm_log_stream()
+            emit_llm_chunk = start_llm_log_stream()
+            cancel_event = Event()
+            popup_state.check_cancel_event = cancel_event
             set_popup_busy(
                 busy=True,
                 status_text=self._t("availability_status_checking"),
                 status_tone="busy",
                 show_indicator=True,
+                cancellable=True,
             )
             started = self._start_background_operation(
                 operation=lambda: self._run_availability_check_operation(
@@ -1758,7 +1913,8 @@ class BridgeCalWindow(QWidget):
                     query_text=query_text,
                     language=self._language(),
                     model_id=model_id,
-                    on_parser_chunk=stream_queue.put,
+                    on_parser_chunk=emit_llm_chunk,
+                    cancel_event=cancel_event,
                 ),
                 on_success=on_check_success,
                 on_failure=on_check_failure,
@@ -1766,17 +1922,14 @@ class BridgeCalWindow(QWidget):
             if started:
                 return
             stop_llm_log_stream()
-            set_popup_busy(
-                busy=False,
-                status_text=self._t("availability_status_error"),
-                status_tone="bad",
-                show_indicator=False,
-            )
+            popup_state.check_cancel_event = None
+            show_popup_error()
             self._finish_action()
             self._append_output(self._t("log_another_running"))
 
         def close_popup() -> None:
-            if popup_state["busy"]:
+            # A running check is cancelled on close; other busy work still blocks it.
+            if popup_state.busy and popup_state.check_cancel_event is None:
                 return
             dialog.accept()
 
@@ -1809,6 +1962,8 @@ class BridgeCalWindow(QWidget):
         try:
             dialog.exec()
         finally:
+            if popup_state.check_cancel_event is not None:
+                popup_state.check_cancel_event.set()
             stop_llm_log_stream()
             self._availability_popup_open = False
 
@@ -1820,37 +1975,66 @@ class BridgeCalWindow(QWidget):
         language: str,
         model_id: str,
         on_parser_chunk: Callable[[str], None] | None = None,
+        cancel_event: Event | None = None,
     ) -> AvailabilityResult:
-        from .availability import check_availability, parse_natural_time_range
-        from .google_client import GoogleClient
-        from .outlook_client import OutlookClient
-
+        runtime = _availability_runtime()
         cfg = load_config(config_path)
-        query_range = parse_natural_time_range(
+        query_range = runtime.parse_natural_time_range(
             query_text,
             preferred_language=language if language in {LANG_JA, LANG_EN} else LANG_JA,
             model_id=model_id,
             max_new_tokens=AVAILABILITY_MAX_NEW_TOKENS,
             force_thinking=True,
             on_model_output_chunk=on_parser_chunk,
+            cancel_event=cancel_event,
         )
-
-        outlook_events = list(OutlookClient().list_events(query_range.start, query_range.end))
-        google_events = list(
-            GoogleClient(
-                calendar_id=cfg.google.calendar_id,
-                client_secret_path=cfg.google.client_secret_path,
-                token_path=cfg.google.token_path,
-                insecure_tls_skip_verify=cfg.google.insecure_tls_skip_verify,
-            ).list_events(query_range.start, query_range.end)
+        if cancel_event is not None and cancel_event.is_set():
+            raise CancelledError("Availability check was cancelled.")
+
+        google_client = self._cached_google_client(
+            calendar_id=cfg.google.calendar_id,
+            client_secret_path=cfg.google.client_secret_path,
+            token_path=cfg.google.token_path,
+            insecure_tls_skip_verify=cfg.google.insecure_tls_skip_verify,
         )
-        return check_availability(
+        # The two calendars are independent I/O; fetch Google while Outlook runs here.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="bridgecal-google") as pool:
+            google_future = pool.submit(
+                google_client.list_events, query_range.start, query_range.end
+            )
+            outlook_events = runtime.outlook_client().list_events(
+                query_range.start, query_range.end
+            )
+            google_events = google_future.result()
+        return runtime.check_availability(
             query_text=query_text,
             query_range=query_range,
             outlook_events=outlook_events,
             google_events=google_events,
         )
 
+    def _cached_google_client(
+        self,
+        *,
+        calendar_id: str,
+        client_secret_path: Path,
+        token_path: Path,
+        insecure_tls_skip_verify: bool,
+    ) -> GoogleClient:
+        # Reusing the client keeps its credentials and HTTP session across checks.
+        key = (calendar_id, client_secret_path, token_path, insecure_tls_skip_verify)
+        cached = self._google_client_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        client = _availability_runtime().google_client(
+            calendar_id=calendar_id,
+            client_secret_path=client_secret_path,
+            token_path=token_path,
+            insecure_tls_skip_verify=insecure_tls_skip_verify,
+        )
+        self._google_client_cache = (key, client)
+        return client
+
     def _run_voice_input_operation(
         self,
         *,
@@ -1879,25 +2063,33 @@ class BridgeCalWindow(QWidget):
             return "\n".join(lines)
 
         lines.append(self._t("availability_result_busy", count=len(result.conflicts)))
+        # Resolve the per-row strings once rather than once per conflict.
+        conflict_template = self._template("availability_result_conflict")
+        outlook_label = self._t("availability_source_outlook")
+        google_label = self._t("availability_source_google")
+        all_day_label = self._t("availability_result_all_day")
+        empty_summary = self._t("availability_summary_empty")
         for conflict in result.conflicts:
-            start_label, end_label = self._format_conflict_time_range(conflict)
-            summary = conflict.summary.strip() or self._t("availability_summary_empty")
+            start_label, end_label = self._format_conflict_time_range(
+                conflict, all_day_label=all_day_label
+            )
             lines.append(
-                self._t(
-                    "availability_result_conflict",
-                    source=self._availability_source_label(conflict.origin),
+                conflict_template.format(
+                    source=outlook_label if conflict.origin == "outlook" else google_label,
                     start=start_label,
                     end=end_label,
-                    summary=summary,
+                    summary=conflict.summary.strip() or empty_summary,
                 )
             )
         return "\n".join(lines)
 
-    def _format_conflict_time_range(self, conflict: AvailabilityConflict) -> tuple[str, str]:
+    def _format_conflict_time_range(
+        self, conflict: AvailabilityConflict, *, all_day_label: str
+    ) -> tuple[str, str]:
         if conflict.all_day:
             return (
-                f"{conflict.start.strftime('%Y-%m-%d')} {self._t('availability_result_all_day')}",
-                f"{conflict.end.strftime('%Y-%m-%d')} {self._t('availability_result_all_day')}",
+                f"{conflict.start.date().isoformat()} {all_day_label}",
+                f"{conflict.end.date().isoformat()} {all_day_label}",
             )
         return (
             self._format_availability_time(conflict.start),
@@ -1905,13 +2097,9 @@ class BridgeCalWindow(QWidget):
         )
 
     def _format_availability_time(self, value: datetime) -> str:
-        local_value = value.astimezone() if value.tzinfo is not None else value
-        return local_value.strftime("%Y-%m-%d %H:%M")
-
-    def _availability_source_label(self, origin: str) -> str:
-        if origin == "outlook":
-            return self._t("availability_source_outlook")
-        return self._t("availability_source_google")
+        v = value.astimezone() if value.tzinfo is not None else value
+        # Fixed ASCII layout; f-string fields avoid strftime's locale-aware path.
+        return f"{v.year:04d}-{v.month:02d}-{v.day:02d} {v.hour:02d}:{v.minute:02d}"
 
     def _setup_scheduler(self) -> None:
         config_path = self._ensure_config_exists()
@@ -1958,16 +2146,23 @@ class BridgeCalWindow(QWidget):
             show_loading=True,
         )
 
-    def _schedule_async_scheduler_status_refresh(self) -> None:
-        QTimer.singleShot(
-            0,
-            lambda: self._refresh_scheduler_status(
-                emit_log=True,
-                interactive=False,
-                show_loading=False,
-            ),
+    def _refresh_scheduler_status_silently(self) -> None:
+        self._refresh_scheduler_status(
+            emit_log=False,
+            interactive=False,
+            show_loading=False,
         )
 
+    def _refresh_scheduler_status_with_log(self) -> None:
+        self._refresh_scheduler_status(
+            emit_log=True,
+            interactive=False,
+            show_loading=False,
+        )
+
+    def _schedule_async_scheduler_status_refresh(self) -> None:
+        QTimer.singleShot(0, self._refresh_scheduler_status_with_log)
+
     def _refresh_scheduler_status(
         self,
         *,
@@ -1983,7 +2178,7 @@ class BridgeCalWindow(QWidget):
                 self._append_output(self._t("log_another_running"))
             return
 
-        if self._background_thread is not None:
+        if self._scheduler_status_query_running:
             if interactive:
                 self._append_output(self._t("log_another_running"))
             return
@@ -2009,6 +2204,8 @@ class BridgeCalWindow(QWidget):
                 interactive=interactive,
             ),
         )
+        if started:
+            self._scheduler_status_query_running = True
         if started and show_loading:
             self._set_scheduler_loading(True)
             return
@@ -2065,6 +2262,7 @@ class BridgeCalWindow(QWidget):
         emit_log: bool,
         interactive: bool,
     ) -> None:
+        self._scheduler_status_query_running = False
         self._set_scheduler_loading(False)
         status_changed = status != self._last_scheduler_status
         self._last_scheduler_status = status
@@ -2073,6 +2271,7 @@ class BridgeCalWindow(QWidget):
             self._finish_action()
 
     def _on_scheduler_status_fetch_failed(self, *, error: str, interactive: bool) -> None:
+        self._scheduler_status_query_running = False
         self._set_scheduler_loading(False)
         status = f"Unknown ({error})"
         status_changed = status != self._last_scheduler_status
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from queue import SimpleQueue
 
 NOISY_OAUTH_LOGGERS = (
     "google_auth_oauthlib.flow",
@@ -10,14 +12,18 @@ NOISY_OAUTH_LOGGERS = (
     "requests_oauthlib",
 )
 
+_queue_listener: QueueListener | None = None
+
 
 def configure_logging(log_path: Path, level: str = "INFO") -> None:
+    global _queue_listener
+
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
     root = logging.getLogger()
     for handler in list(root.handlers):
         root.removeHandler(handler)
-    root.setLevel(level)
+    shutdown_logging()
 
     fmt = logging.Formatter(
         fmt="%(asctime)s %(levelname)s %(name)s - %(message)s",
@@ -26,13 +32,34 @@ def configure_logging(log_path: Path, level: str = "INFO") -> None:
 
     console = logging.StreamHandler()
     console.setFormatter(fmt)
-    root.addHandler(console)
 
     file_handler = RotatingFileHandler(
         log_path, maxBytes=5_000_000, backupCount=3, encoding="utf-8"
     )
     file_handler.setFormatter(fmt)
-    root.addHandler(file_handler)
+
+    # Callers only enqueue records; formatting and file I/O run on the listener thread.
+    log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, console, file_handler, respect_handler_level=True)
+    _queue_listener.start()
+    root.setLevel(level)
 
     for logger_name in NOISY_OAUTH_LOGGERS:
         logging.getLogger(logger_name).setLevel(logging.WARNING)
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background listener, if one is running."""
+    global _queue_listener
+
+    listener = _queue_listener
+    _queue_listener = None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(shutdown_logging)
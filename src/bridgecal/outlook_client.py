@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 from collections.abc import Sequence
 from dataclasses import replace
 from datetime import UTC, datetime, time
@@ -32,6 +33,9 @@ OUTLOOK_APPLICATION_CLSID = "{0006F03A-0000-0000-C000-000000000046}"
 OUTLOOK_CONNECT_RETRIES = 6
 OUTLOOK_CONNECT_RETRY_DELAY_SECONDS = 2.0
 OUTLOOK_CALL_REJECTED_HRESULT = -2147418111
+OUTLOOK_RETRY_LATER_HRESULT = -2147417846
+OUTLOOK_BUSY_HRESULTS = frozenset({OUTLOOK_CALL_REJECTED_HRESULT, OUTLOOK_RETRY_LATER_HRESULT})
+OUTLOOK_BUSY_TEXT_RE = re.compile(r"call was rejected by callee|application is busy", re.IGNORECASE)
 
 
 def _extract_executable_path(command: str) -> str | None:
@@ -43,17 +47,16 @@ def _extract_executable_path(command: str) -> str | None:
         if end <= 1:
             return None
         return text[1:end].strip() or None
-    return text.split(" ", 1)[0].strip() or None
+    end = text.find(" ")
+    return text if end == -1 else text[:end]
 
 
 def _is_outlook_busy_error(exc: Exception) -> bool:
-    if "call was rejected by callee" in str(exc).lower():
-        return True
+    # com_error carries the HRESULT as args[0]; check it before formatting the message.
     args = getattr(exc, "args", ())
-    if not args:
-        return False
-    code = args[0]
-    return isinstance(code, int) and code == OUTLOOK_CALL_REJECTED_HRESULT
+    if args and isinstance(args[0], int) and args[0] in OUTLOOK_BUSY_HRESULTS:
+        return True
+    return OUTLOOK_BUSY_TEXT_RE.search(str(exc)) is not None
 
 
 class OutlookClient:
@@ -62,8 +65,14 @@ class OutlookClient:
     def __init__(self) -> None:
         self._namespace: Any | None = None
         self._application: Any | None = None
+        self._mirror_index: dict[str, Any] | None = None
+        self._local_tz = datetime.now().astimezone().tzinfo
 
     def list_events(self, window_start: datetime, window_end: datetime) -> Sequence[CanonicalEvent]:
+        # A new listing starts a sync pass; mirrors may have changed in Outlook since the last one,
+        # and a daemon can outlive a DST switch, so re-resolve the local offset here too.
+        self._mirror_index = None
+        self._local_tz = datetime.now().astimezone().tzinfo
         items = self._calendar_items(window_start, window_end)
         events: list[CanonicalEvent] = []
         for item in items:
@@ -85,6 +94,8 @@ class OutlookClient:
         event_id = self._entry_id(appointment)
         if not event_id:
             raise RuntimeError("Outlook did not return EntryID after save.")
+        if self._mirror_index is not None:
+            self._mirror_index[source.source_id] = appointment
         return event_id
 
     def delete_event(self, outlook_id: str) -> None:
@@ -94,6 +105,7 @@ class OutlookClient:
         except Exception:
             return
 
+        self._mirror_index = None
         try:
             item.Delete()
         except Exception:
@@ -111,9 +123,15 @@ class OutlookClient:
         pythoncom.CoInitialize()
         last_error: Exception | None = None
         launched_outlook = False
+        # Early-bound dispatch calls through the typelib vtable instead of IDispatch::Invoke,
+        # which adds up over the per-item property reads of a sync pass.
+        dispatchers = (
+            getattr(getattr(win32_client, "gencache", None), "EnsureDispatch", None),
+            getattr(win32_client, "Dispatch", None),
+            getattr(win32_client, "DispatchEx", None),
+        )
         for attempt in range(OUTLOOK_CONNECT_RETRIES):
-            for dispatch_name in ("Dispatch", "DispatchEx"):
-                dispatch = getattr(win32_client, dispatch_name, None)
+            for dispatch in dispatchers:
                 if dispatch is None:
                     continue
                 try:
@@ -233,6 +251,8 @@ class OutlookClient:
     def _calendar_items(self, window_start: datetime, window_end: datetime) -> Any:
         folder = self._ensure_calendar_folder()
         items = folder.Items
+        # Outlook only expands recurring series when the collection is sorted by [Start] with
+        # IncludeRecurrences set *before* Restrict, so this order cannot be flipped.
         items.Sort("[Start]")
         items.IncludeRecurrences = True
 
@@ -255,8 +275,9 @@ class OutlookClient:
         if not source_id:
             return None
 
-        mirror_origin = self._get_user_prop(item, MIRROR_ORIGIN_PROP)
-        mirror_google_id = self._get_user_prop(item, MIRROR_GOOGLE_ID_PROP)
+        props = getattr(item, "UserProperties", None)
+        mirror_origin = self._find_user_prop(props, MIRROR_ORIGIN_PROP)
+        mirror_google_id = self._find_user_prop(props, MIRROR_GOOGLE_ID_PROP)
 
         last_modified = self._to_aware_datetime(getattr(item, "LastModificationTime", None))
         event = CanonicalEvent(
@@ -321,10 +342,9 @@ class OutlookClient:
         if value.tzinfo is not None:
             return value.astimezone(UTC)
 
-        local_tz = datetime.now().astimezone().tzinfo
-        if local_tz is None:
+        if self._local_tz is None:
             return value.replace(tzinfo=UTC)
-        return value.replace(tzinfo=local_tz).astimezone(UTC)
+        return value.replace(tzinfo=self._local_tz).astimezone(UTC)
 
     def _to_wall_datetime(self, value: Any) -> datetime | None:
         if not isinstance(value, datetime):
@@ -333,8 +353,7 @@ class OutlookClient:
             return value
         return value.replace(tzinfo=None)
 
-    def _get_user_prop(self, item: Any, name: str) -> str:
-        props = getattr(item, "UserProperties", None)
+    def _find_user_prop(self, props: Any, name: str) -> str:
         if props is None:
             return ""
 
@@ -350,18 +369,33 @@ class OutlookClient:
         props = item.UserProperties
         prop = props.Find(name)
         if prop is None:
-            prop = props.Add(name, OL_USER_PROPERTY_TEXT)
+            # AddToFolderFields lets Items.Restrict filter on the property inside MAPI.
+            prop = props.Add(name, OL_USER_PROPERTY_TEXT, True)
         prop.Value = value
 
     def _find_google_mirror(self, google_id: str) -> Any | None:
-        folder = self._ensure_calendar_folder()
-        items = folder.Items
+        if self._mirror_index is None:
+            self._mirror_index = self._build_mirror_index()
+        return self._mirror_index.get(google_id)
+
+    def _build_mirror_index(self) -> dict[str, Any]:
+        items = self._ensure_calendar_folder().Items
+        try:
+            # Only works once the property is a folder field; otherwise fall back to a full scan.
+            items = items.Restrict(f"[{MIRROR_ORIGIN_PROP}] = 'google'")
+            restricted = True
+        except Exception:
+            restricted = False
+
+        index: dict[str, Any] = {}
         for item in items:
-            if self._get_user_prop(item, MIRROR_ORIGIN_PROP) != "google":
+            props = getattr(item, "UserProperties", None)
+            if not restricted and self._find_user_prop(props, MIRROR_ORIGIN_PROP) != "google":
                 continue
-            if self._get_user_prop(item, MIRROR_GOOGLE_ID_PROP) == google_id:
-                return item
-        return None
+            google_id = self._find_user_prop(props, MIRROR_GOOGLE_ID_PROP)
+            if google_id:
+                index.setdefault(google_id, item)
+        return index
 
     def _apply_source_to_appointment(self, item: Any, source: CanonicalEvent) -> None:
         item.MeetingStatus = OL_NON_MEETING
@@ -393,8 +427,7 @@ class OutlookClient:
 
     def _to_outlook_utc_datetime(self, value: datetime) -> datetime:
         if value.tzinfo is None:
-            local_tz = datetime.now().astimezone().tzinfo
-            if local_tz is None:
+            if self._local_tz is None:
                 return value.replace(tzinfo=UTC)
-            return value.replace(tzinfo=local_tz).astimezone(UTC)
+            return value.replace(tzinfo=self._local_tz).astimezone(UTC)
         return value.astimezone(UTC)
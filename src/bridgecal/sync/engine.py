@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Protocol
 
 from .mapping import MappingRow, MappingStore
@@ -12,6 +14,21 @@ from .models import CanonicalEvent, compute_fingerprint
 logger = logging.getLogger(__name__)
 
 
+# Stored timestamps repeat across rows and passes; parsed datetimes are immutable, so share them.
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime | None:
+    if not value:
+        return None
+    text = value.strip().replace("Z", "+00:00")
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed
+
+
 @dataclass
 class SyncStats:
     outlook_scanned: int = 0
@@ -49,10 +66,24 @@ class GooglePort(Protocol):
         """Create/update a Google mirror event and return its google_event_id."""
         ...
 
+    def upsert_mirrors(
+        self,
+        sources: Sequence[CanonicalEvent],
+        on_upserted: Callable[[CanonicalEvent, str], None],
+    ) -> None:
+        """Create/update many Google mirrors, reporting each (source, google_event_id)."""
+        ...
+
     def delete_event(self, google_event_id: str) -> None: ...
 
+    def delete_events(self, google_event_ids: Sequence[str]) -> set[str]:
+        """Delete many Google events and return the ids that are now gone."""
+        ...
+
 
 class SyncEngine:
+    __slots__ = ("outlook", "google", "store")
+
     def __init__(self, outlook: OutlookPort, google: GooglePort, store: MappingStore) -> None:
         self.outlook = outlook
         self.google = google
@@ -69,8 +100,12 @@ class SyncEngine:
         window_start = now - timedelta(days=past_days)
         window_end = now + timedelta(days=future_days)
 
-        outlook_events = list(self.outlook.list_events(window_start, window_end))
-        google_events = list(self.google.list_events(window_start, window_end))
+        # Google is plain HTTPS and can run on a worker; Outlook COM stays on this thread's
+        # apartment, so its scan hides the Google round-trips.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="bridgecal-google") as pool:
+            google_future = pool.submit(self.google.list_events, window_start, window_end)
+            outlook_events = list(self.outlook.list_events(window_start, window_end))
+            google_events = list(google_future.result())
 
         stats = SyncStats(outlook_scanned=len(outlook_events), google_scanned=len(google_events))
 
@@ -82,24 +117,29 @@ class SyncEngine:
         stats.google_sources = len(google_sources)
         stats.outlook_mirrors = len(outlook_all) - len(outlook_sources)
         stats.google_mirrors = len(google_all) - len(google_sources)
+        outlook_keys = self._event_keys(outlook_all)
+        google_keys = self._event_keys(google_all)
 
-        rows = list(self.store.list_all())
+        # Materialized on purpose: the pass needs the count up front and rewrites the table
+        # while walking it, which an open SELECT cursor must not see.
+        outlook_rows = list(self.store.iter_by_origin("outlook"))
+        google_rows = list(self.store.iter_by_origin("google"))
         predicted_consumed_outlook = {
-            row.outlook_id
-            for row in rows
-            if row.origin == "outlook" and row.outlook_id in outlook_sources
+            row.outlook_id for row in outlook_rows if row.outlook_id in outlook_sources
         }
         predicted_consumed_google = {
-            row.google_id
-            for row in rows
-            if row.origin == "google" and row.google_id in google_sources
+            row.google_id for row in google_rows if row.google_id in google_sources
         }
         remaining_outlook_sources = len(outlook_sources) - len(predicted_consumed_outlook)
         remaining_google_sources = len(google_sources) - len(predicted_consumed_google)
 
         progress_total = max(
             1,
-            2 + len(rows) + remaining_outlook_sources + remaining_google_sources,
+            2
+            + len(outlook_rows)
+            + len(google_rows)
+            + remaining_outlook_sources
+            + remaining_google_sources,
         )
         progress_done = 0
 
@@ -116,62 +156,96 @@ class SyncEngine:
         progress_done += 1
         emit_progress("scan_google")
 
-        consumed_outlook_sources: set[str] = set()
-        consumed_google_sources: set[str] = set()
+        # One transaction for the whole pass instead of a commit per mapping write.
+        with self.store:
+            consumed_outlook_sources: set[str] = set()
+            consumed_google_sources: set[str] = set()
+            orphaned_outlook_rows: list[MappingRow] = []
+            orphaned_google_rows: list[MappingRow] = []
 
-        for row in rows:
-            if row.origin == "outlook":
+            for row in outlook_rows:
                 self._reconcile_outlook_origin(
                     row=row,
                     stats=stats,
                     outlook_sources=outlook_sources,
                     google_all=google_all,
+                    source_keys=outlook_keys,
+                    target_keys=google_keys,
                     consumed_outlook_sources=consumed_outlook_sources,
+                    orphaned_rows=orphaned_outlook_rows,
                 )
-            else:
+                progress_done += 1
+                emit_progress("reconcile")
+
+            for row in google_rows:
                 self._reconcile_google_origin(
                     row=row,
                     stats=stats,
                     google_sources=google_sources,
                     outlook_all=outlook_all,
+                    source_keys=google_keys,
+                    target_keys=outlook_keys,
                     consumed_google_sources=consumed_google_sources,
+                    orphaned_rows=orphaned_google_rows,
+                )
+                progress_done += 1
+                emit_progress("reconcile")
+
+            # Sources that vanished: drop their mirrors in one batch, then the pairs whose
+            # mirror is gone. Pairs of failed deletes stay so the next pass retries them.
+            if orphaned_outlook_rows:
+                gone = self.google.delete_events([row.google_id for row in orphaned_outlook_rows])
+                gone_rows = [row for row in orphaned_outlook_rows if row.google_id in gone]
+                stats.deleted_in_google -= len(orphaned_outlook_rows) - len(gone_rows)
+                self.store.delete_pairs((row.outlook_id, row.google_id) for row in gone_rows)
+            if orphaned_google_rows:
+                for row in orphaned_google_rows:
+                    self.outlook.delete_event(row.outlook_id)
+                self.store.delete_pairs(
+                    (row.outlook_id, row.google_id) for row in orphaned_google_rows
                 )
-            progress_done += 1
-            emit_progress("reconcile")
 
-        for source in outlook_sources.values():
-            if source.source_id in consumed_outlook_sources:
-                continue
-            google_id = self.google.upsert_mirror(source)
-            self.store.upsert(
-                MappingRow(
-                    outlook_id=source.source_id,
-                    google_id=google_id,
-                    origin="outlook",
-                    last_outlook_fp=compute_fingerprint(source),
-                    last_outlook_modified=self._dt_key(source.last_modified),
+            def record_google_mirror(source: CanonicalEvent, google_id: str) -> None:
+                nonlocal progress_done
+                source_fp, source_modified = outlook_keys[source.source_id]
+                self.store.upsert(
+                    MappingRow(
+                        outlook_id=source.source_id,
+                        google_id=google_id,
+                        origin="outlook",
+                        last_outlook_fp=source_fp,
+                        last_outlook_modified=source_modified,
+                    )
                 )
+                stats.created_in_google += 1
+                progress_done += 1
+                emit_progress("create_google")
+
+            # New Google mirrors go out as batched HTTP requests instead of one call each.
+            self.google.upsert_mirrors(
+                [
+                    outlook_sources[source_id]
+                    for source_id in outlook_sources.keys() - consumed_outlook_sources
+                ],
+                record_google_mirror,
             )
-            stats.created_in_google += 1
-            progress_done += 1
-            emit_progress("create_google")
 
-        for source in google_sources.values():
-            if source.source_id in consumed_google_sources:
-                continue
-            outlook_id = self.outlook.upsert_mirror(source)
-            self.store.upsert(
-                MappingRow(
-                    outlook_id=outlook_id,
-                    google_id=source.source_id,
-                    origin="google",
-                    last_google_fp=compute_fingerprint(source),
-                    last_google_updated=self._dt_key(source.last_modified),
+            for source_id in google_sources.keys() - consumed_google_sources:
+                source = google_sources[source_id]
+                outlook_id = self.outlook.upsert_mirror(source)
+                source_fp, source_modified = google_keys[source_id]
+                self.store.upsert(
+                    MappingRow(
+                        outlook_id=outlook_id,
+                        google_id=source_id,
+                        origin="google",
+                        last_google_fp=source_fp,
+                        last_google_updated=source_modified,
+                    )
                 )
-            )
-            stats.created_in_outlook += 1
-            progress_done += 1
-            emit_progress("create_outlook")
+                stats.created_in_outlook += 1
+                progress_done += 1
+                emit_progress("create_outlook")
 
         if progress_done < progress_total:
             progress_done = progress_total
@@ -201,25 +275,35 @@ class SyncEngine:
         stats: SyncStats,
         outlook_sources: dict[str, CanonicalEvent],
         google_all: dict[str, CanonicalEvent],
+        source_keys: dict[str, tuple[str, str]],
+        target_keys: dict[str, tuple[str, str]],
         consumed_outlook_sources: set[str],
+        orphaned_rows: list[MappingRow],
     ) -> None:
         source = outlook_sources.get(row.outlook_id)
         if source is None:
-            self.google.delete_event(row.google_id)
-            self.store.delete_pair(row.outlook_id, row.google_id)
+            orphaned_rows.append(row)
             stats.deleted_in_google += 1
             return
 
         consumed_outlook_sources.add(source.source_id)
         target = google_all.get(row.google_id)
 
-        source_changed = self._event_changed(source, row.last_outlook_fp, row.last_outlook_modified)
+        source_fp, source_modified = source_keys[source.source_id]
+        target_fp, target_modified = (
+            target_keys[target.source_id] if target is not None else ("", "")
+        )
+        source_changed = self._event_changed(
+            source, source_fp, source_modified, row.last_outlook_fp, row.last_outlook_modified
+        )
         has_target_baseline = bool(row.last_google_fp or row.last_google_updated)
         target_changed = (
             target is not None
             and has_target_baseline
             and self._event_changed(
                 target,
+                target_fp,
+                target_modified,
                 row.last_google_fp,
                 row.last_google_updated,
             )
@@ -246,22 +330,21 @@ class SyncEngine:
             if google_id != row.google_id:
                 self.store.delete_pair(row.outlook_id, row.google_id)
 
-        current_target = google_all.get(google_id)
-        self.store.upsert(
-            MappingRow(
-                outlook_id=source.source_id,
-                google_id=google_id,
-                origin="outlook",
-                last_outlook_fp=compute_fingerprint(source),
-                last_google_fp=compute_fingerprint(current_target)
-                if current_target
-                else row.last_google_fp,
-                last_outlook_modified=self._dt_key(source.last_modified),
-                last_google_updated=self._dt_key(current_target.last_modified)
-                if current_target
-                else row.last_google_updated,
-            )
+        current_target_fp, current_target_modified = target_keys.get(
+            google_id, (row.last_google_fp, row.last_google_updated)
+        )
+        updated_row = MappingRow(
+            outlook_id=source.source_id,
+            google_id=google_id,
+            origin="outlook",
+            last_outlook_fp=source_fp,
+            last_google_fp=current_target_fp,
+            last_outlook_modified=source_modified,
+            last_google_updated=current_target_modified,
         )
+        # Steady-state pairs produce the row already stored; skip the redundant write.
+        if updated_row != row:
+            self.store.upsert(updated_row)
 
     def _reconcile_google_origin(
         self,
@@ -270,25 +353,35 @@ class SyncEngine:
         stats: SyncStats,
         google_sources: dict[str, CanonicalEvent],
         outlook_all: dict[str, CanonicalEvent],
+        source_keys: dict[str, tuple[str, str]],
+        target_keys: dict[str, tuple[str, str]],
         consumed_google_sources: set[str],
+        orphaned_rows: list[MappingRow],
     ) -> None:
         source = google_sources.get(row.google_id)
         if source is None:
-            self.outlook.delete_event(row.outlook_id)
-            self.store.delete_pair(row.outlook_id, row.google_id)
+            orphaned_rows.append(row)
             stats.deleted_in_outlook += 1
             return
 
         consumed_google_sources.add(source.source_id)
         target = outlook_all.get(row.outlook_id)
 
-        source_changed = self._event_changed(source, row.last_google_fp, row.last_google_updated)
+        source_fp, source_modified = source_keys[source.source_id]
+        target_fp, target_modified = (
+            target_keys[target.source_id] if target is not None else ("", "")
+        )
+        source_changed = self._event_changed(
+            source, source_fp, source_modified, row.last_google_fp, row.last_google_updated
+        )
         has_target_baseline = bool(row.last_outlook_fp or row.last_outlook_modified)
         target_changed = (
             target is not None
             and has_target_baseline
             and self._event_changed(
                 target,
+                target_fp,
+                target_modified,
                 row.last_outlook_fp,
                 row.last_outlook_modified,
             )
@@ -315,22 +408,20 @@ class SyncEngine:
             if outlook_id != row.outlook_id:
                 self.store.delete_pair(row.outlook_id, row.google_id)
 
-        current_target = outlook_all.get(outlook_id)
-        self.store.upsert(
-            MappingRow(
-                outlook_id=outlook_id,
-                google_id=source.source_id,
-                origin="google",
-                last_outlook_fp=compute_fingerprint(current_target)
-                if current_target
-                else row.last_outlook_fp,
-                last_google_fp=compute_fingerprint(source),
-                last_outlook_modified=self._dt_key(current_target.last_modified)
-                if current_target
-                else row.last_outlook_modified,
-                last_google_updated=self._dt_key(source.last_modified),
-            )
+        current_target_fp, current_target_modified = target_keys.get(
+            outlook_id, (row.last_outlook_fp, row.last_outlook_modified)
+        )
+        updated_row = MappingRow(
+            outlook_id=outlook_id,
+            google_id=source.source_id,
+            origin="google",
+            last_outlook_fp=current_target_fp,
+            last_google_fp=source_fp,
+            last_outlook_modified=current_target_modified,
+            last_google_updated=source_modified,
         )
+        if updated_row != row:
+            self.store.upsert(updated_row)
 
     def _index_events(self, events: Sequence[CanonicalEvent]) -> dict[str, CanonicalEvent]:
         indexed: dict[str, CanonicalEvent] = {}
@@ -343,20 +434,35 @@ class SyncEngine:
                 indexed[event.source_id] = event
         return indexed
 
-    def _event_changed(self, event: CanonicalEvent, last_fp: str, last_modified: str) -> bool:
-        current_fp = compute_fingerprint(event)
+    def _event_changed(
+        self,
+        event: CanonicalEvent,
+        current_fp: str,
+        current_modified: str,
+        last_fp: str,
+        last_modified: str,
+    ) -> bool:
         if not last_fp:
             return True
         if current_fp != last_fp:
             return True
-
-        prev_ts = self._parse_dt(last_modified)
-        if event.last_modified is None:
+        # Steady state: the stored key is exactly what _dt_key produced last time, so an
+        # equal string means an equal timestamp and the parse below can be skipped.
+        if event.last_modified is None or current_modified == last_modified:
             return False
+
+        prev_ts = _parse_iso(last_modified)
         if prev_ts is None:
             return True
         return event.last_modified > prev_ts
 
+    def _event_keys(self, events: dict[str, CanonicalEvent]) -> dict[str, tuple[str, str]]:
+        """Fingerprint and modified-time key per event, computed once for the whole pass."""
+        return {
+            source_id: (compute_fingerprint(event), self._dt_key(event.last_modified))
+            for source_id, event in events.items()
+        }
+
     def _source_wins(self, source: CanonicalEvent, target: CanonicalEvent) -> bool:
         source_ts = source.last_modified
         target_ts = target.last_modified
@@ -373,15 +479,3 @@ class SyncEngine:
         if value is None:
             return ""
         return value.isoformat()
-
-    def _parse_dt(self, value: str) -> datetime | None:
-        if not value:
-            return None
-        text = value.strip().replace("Z", "+00:00")
-        try:
-            parsed = datetime.fromisoformat(text)
-        except ValueError:
-            return None
-        if parsed.tzinfo is None:
-            return parsed.replace(tzinfo=UTC)
-        return parsed
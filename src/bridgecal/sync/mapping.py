@@ -1,13 +1,26 @@
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
-from .models import Origin
+from .models import FINGERPRINT_SCHEME, Origin
 
+MAPPING_FETCH_BATCH = 500
+MAPPING_UPSERT_SQL = """
+INSERT INTO mapping(outlook_id, google_id, origin, last_outlook_fp, last_google_fp, last_outlook_modified, last_google_updated)
+VALUES(?,?,?,?,?,?,?)
+ON CONFLICT(outlook_id, google_id) DO UPDATE SET
+  origin=excluded.origin,
+  last_outlook_fp=excluded.last_outlook_fp,
+  last_google_fp=excluded.last_google_fp,
+  last_outlook_modified=excluded.last_outlook_modified,
+  last_google_updated=excluded.last_google_updated
+"""
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class MappingRow:
     outlook_id: str
     google_id: str
@@ -18,19 +31,53 @@ class MappingRow:
     last_google_updated: str = ""
 
 
+MEMORY_DB = ":memory:"
+
+
 class MappingStore:
-    def __init__(self, db_path: Path) -> None:
-        self.db_path = db_path
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+    def __init__(self, db_path: Path | str) -> None:
+        # MEMORY_DB keeps the store in RAM, which is all tests that never reopen it need.
+        self.db_path = db_path if db_path == MEMORY_DB else Path(db_path)
+        if isinstance(self.db_path, Path):
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn = sqlite3.connect(self.db_path)
         self._conn.row_factory = sqlite3.Row
+        self._batch_depth = 0
+        self._pending_upserts: list[tuple[str, ...]] = []
         self._init_schema()
 
     def close(self) -> None:
         self._conn.close()
 
+    def __enter__(self) -> MappingStore:
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self._batch_depth -= 1
+        # Commit even when the batch failed part-way: rows written so far describe remote
+        # changes that have already happened, so rolling them back would lose track of them.
+        self._commit()
+
+    def _commit(self) -> None:
+        if self._batch_depth == 0:
+            self._flush_upserts()
+            self._conn.commit()
+
+    def _flush_upserts(self) -> None:
+        # Upserts inside a batch are queued and sent with one executemany; anything that
+        # reads or deletes rows flushes first so statement order is unchanged.
+        if not self._pending_upserts:
+            return
+        self._conn.executemany(MAPPING_UPSERT_SQL, self._pending_upserts)
+        self._pending_upserts.clear()
+
     def _init_schema(self) -> None:
         cur = self._conn.cursor()
+        # WAL keeps a sync's single batch commit from rewriting the main database file.
+        cur.execute("PRAGMA journal_mode=WAL;")
+        cur.execute("PRAGMA synchronous=NORMAL;")
+        cur.execute("PRAGMA cache_size=-20000;")
         cur.execute(
             """
             CREATE TABLE IF NOT EXISTS mapping (
@@ -45,6 +92,8 @@ class MappingStore:
             );
             """
         )
+        # outlook_id lookups use the primary key prefix; google_id needs its own index.
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_mapping_google ON mapping(google_id);")
         cur.execute(
             """
             CREATE TABLE IF NOT EXISTS kv (
@@ -56,23 +105,31 @@ class MappingStore:
         cols = [r["name"] for r in cur.execute("PRAGMA table_info(mapping);").fetchall()]
         if "origin" not in cols:
             cur.execute("ALTER TABLE mapping ADD COLUMN origin TEXT NOT NULL DEFAULT 'outlook';")
+        scheme_row = cur.execute("SELECT v FROM kv WHERE k='fp_algo'").fetchone()
+        if scheme_row is None or scheme_row[0] != FINGERPRINT_SCHEME:
+            # Fingerprints from another scheme can never match; drop them so the next sync
+            # re-baselines every pair once.
+            cur.execute("UPDATE mapping SET last_outlook_fp='', last_google_fp=''")
+            cur.execute(
+                "INSERT INTO kv(k, v) VALUES('fp_algo', ?) ON CONFLICT(k) DO UPDATE SET v=excluded.v",
+                (FINGERPRINT_SCHEME,),
+            )
         self._conn.commit()
 
     def _row_to_mapping(self, row: sqlite3.Row) -> MappingRow:
-        raw = dict(row)
-        origin_raw = str(raw.get("origin", "outlook"))
-        origin: Origin = "google" if origin_raw == "google" else "outlook"
+        # Every column is NOT NULL TEXT, so sqlite3.Row values can be used as-is.
         return MappingRow(
-            outlook_id=str(raw["outlook_id"]),
-            google_id=str(raw["google_id"]),
-            origin=origin,
-            last_outlook_fp=str(raw.get("last_outlook_fp", "")),
-            last_google_fp=str(raw.get("last_google_fp", "")),
-            last_outlook_modified=str(raw.get("last_outlook_modified", "")),
-            last_google_updated=str(raw.get("last_google_updated", "")),
+            outlook_id=row["outlook_id"],
+            google_id=row["google_id"],
+            origin="google" if row["origin"] == "google" else "outlook",
+            last_outlook_fp=row["last_outlook_fp"],
+            last_google_fp=row["last_google_fp"],
+            last_outlook_modified=row["last_outlook_modified"],
+            last_google_updated=row["last_google_updated"],
         )
 
     def get_by_outlook(self, outlook_id: str) -> MappingRow | None:
+        self._flush_upserts()
         cur = self._conn.cursor()
         row = cur.execute("SELECT * FROM mapping WHERE outlook_id = ?", (outlook_id,)).fetchone()
         if not row:
@@ -80,30 +137,36 @@ class MappingStore:
         return self._row_to_mapping(row)
 
     def get_by_google(self, google_id: str) -> MappingRow | None:
+        self._flush_upserts()
         cur = self._conn.cursor()
         row = cur.execute("SELECT * FROM mapping WHERE google_id = ?", (google_id,)).fetchone()
         if not row:
             return None
         return self._row_to_mapping(row)
 
-    def list_all(self) -> list[MappingRow]:
+    def iter_all(self) -> Iterator[MappingRow]:
+        return self._iter_rows("SELECT * FROM mapping", ())
+
+    def iter_by_origin(self, origin: Origin) -> Iterator[MappingRow]:
+        return self._iter_rows("SELECT * FROM mapping WHERE origin = ?", (origin,))
+
+    def _iter_rows(self, sql: str, params: tuple[str, ...]) -> Iterator[MappingRow]:
+        self._flush_upserts()
         cur = self._conn.cursor()
-        rows = cur.execute("SELECT * FROM mapping").fetchall()
-        return [self._row_to_mapping(row) for row in rows]
+        cur.arraysize = MAPPING_FETCH_BATCH
+        cur.execute(sql, params)
+        while rows := cur.fetchmany():
+            for row in rows:
+                yield self._row_to_mapping(row)
+
+    def list_all(self) -> list[MappingRow]:
+        return list(self.iter_all())
 
     def upsert(self, m: MappingRow) -> None:
-        cur = self._conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO mapping(outlook_id, google_id, origin, last_outlook_fp, last_google_fp, last_outlook_modified, last_google_updated)
-            VALUES(?,?,?,?,?,?,?)
-            ON CONFLICT(outlook_id, google_id) DO UPDATE SET
-              origin=excluded.origin,
-              last_outlook_fp=excluded.last_outlook_fp,
-              last_google_fp=excluded.last_google_fp,
-              last_outlook_modified=excluded.last_outlook_modified,
-              last_google_updated=excluded.last_google_updated
-            """,
+        self.upsert_many((m,))
+
+    def upsert_many(self, rows: Iterable[MappingRow]) -> None:
+        self._pending_upserts.extend(
             (
                 m.outlook_id,
                 m.google_id,
@@ -112,26 +175,35 @@ class MappingStore:
                 m.last_google_fp,
                 m.last_outlook_modified,
                 m.last_google_updated,
-            ),
+            )
+            for m in rows
         )
-        self._conn.commit()
+        self._commit()
 
     def delete_pair(self, outlook_id: str, google_id: str) -> None:
+        self._flush_upserts()
         cur = self._conn.cursor()
         cur.execute(
             "DELETE FROM mapping WHERE outlook_id=? AND google_id=?", (outlook_id, google_id)
         )
-        self._conn.commit()
+        self._commit()
+
+    def delete_pairs(self, pairs: Iterable[tuple[str, str]]) -> None:
+        self._flush_upserts()
+        self._conn.executemany("DELETE FROM mapping WHERE outlook_id=? AND google_id=?", pairs)
+        self._commit()
 
     def delete_by_outlook(self, outlook_id: str) -> None:
+        self._flush_upserts()
         cur = self._conn.cursor()
         cur.execute("DELETE FROM mapping WHERE outlook_id=?", (outlook_id,))
-        self._conn.commit()
+        self._commit()
 
     def delete_by_google(self, google_id: str) -> None:
+        self._flush_upserts()
         cur = self._conn.cursor()
         cur.execute("DELETE FROM mapping WHERE google_id=?", (google_id,))
-        self._conn.commit()
+        self._commit()
 
     def kv_get(self, k: str) -> str | None:
         cur = self._conn.cursor()
@@ -144,4 +216,4 @@ class MappingStore:
             "INSERT INTO kv(k, v) VALUES(?, ?) ON CONFLICT(k) DO UPDATE SET v=excluded.v",
             (k, v),
         )
-        self._conn.commit()
+        self._commit()
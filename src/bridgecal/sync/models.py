@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import hashlib
-import json
 from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Literal
 
 Origin = Literal["outlook", "google"]
 
+# Stored alongside the mapping table; bump whenever the fingerprint inputs or hash change.
+FINGERPRINT_SCHEME = "blake2b-16:us-v2"
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class EventTime:
     """Represents either an all-day or timed event."""
 
@@ -23,7 +25,7 @@ class EventTime:
         return self.start_date is not None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CanonicalEvent:
     origin: Origin
     source_id: str
@@ -58,16 +60,19 @@ def compute_fingerprint(event: CanonicalEvent) -> str:
     if event.fingerprint:
         return event.fingerprint
 
-    payload = {
-        "start_dt": _dt_key(event.time.start_dt),
-        "end_dt": _dt_key(event.time.end_dt),
-        "start_date": _date_key(event.time.start_date),
-        "end_date": _date_key(event.time.end_date),
-        "summary": event.summary,
-        "location": event.location,
-        "description": event.description,
-        "busy": event.busy,
-        "private": event.private,
-    }
-    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return hashlib.sha256(encoded).hexdigest()
+    # Fixed field order is part of FINGERPRINT_SCHEME; the unit separator keeps fields apart.
+    encoded = "\x1f".join(
+        (
+            _dt_key(event.time.start_dt),
+            _dt_key(event.time.end_dt),
+            _date_key(event.time.start_date),
+            _date_key(event.time.end_date),
+            event.summary,
+            event.location,
+            event.description,
+            "1" if event.busy else "0",
+            "1" if event.private else "0",
+        )
+    ).encode("utf-8")
+    # Only compared for equality, so a 128-bit digest is plenty.
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+import logging
+import math
 import os
-import tempfile
 import time
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
 from importlib import import_module, util
 from pathlib import Path
-from threading import Event, Lock
+from threading import Event, Lock, Thread
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_STT_COMPUTE_TYPE = "int8"
+# CTranslate2 GEMMs stop scaling well past this many threads for Whisper-sized models.
+STT_MAX_CPU_THREADS = 8
+STT_WARMUP_SECONDS = 0.5
+WHISPER_SAMPLE_RATE = 16_000
+RECORDING_BLOCK_FRAMES = 512
+# Extra time allowed for the device to deliver the last blocks before recording gives up.
+RECORDING_GRACE_SECONDS = 2.0
+
 
 @dataclass(frozen=True)
 class _DependencyLoadResult:
@@ -16,35 +30,142 @@ class _DependencyLoadResult:
     error: Exception | None = None
 
 
+@dataclass(slots=True)
+class _DependencyLoadState:
+    ready: Event = field(default_factory=Event)
+    result: _DependencyLoadResult | None = None
+
+
 _MODEL_CACHE: dict[tuple[str, str, str], Any] = {}
 _MODEL_LOCK = Lock()
-_DEPENDENCY_CACHE: dict[str, _DependencyLoadResult] = {}
+_DEPENDENCY_CACHE: dict[str, _DependencyLoadState] = {}
 _DEPENDENCY_LOCK = Lock()
+# Push-to-talk reuses the same duration, so one buffer per frame count is kept between calls.
+_RECORD_BUFFERS: dict[int, Any] = {}
+_RECORD_BUFFER_LOCK = Lock()
+_WARMUP_LOCK = Lock()
+_warmup_thread: Thread | None = None
+
+
+def prewarm_whisper_async(
+    *,
+    model_size: str | None = None,
+    compute_type: str | None = None,
+) -> Thread | None:
+    """Load the Whisper model on a daemon thread so the first voice command skips the load.
+
+    No-op unless ``BRIDGECAL_STT_WARMUP`` is enabled. Concurrent transcriptions simply wait
+    on the model lock until the warm-up load finishes.
+    """
+    global _warmup_thread
+
+    if not _read_env_bool("BRIDGECAL_STT_WARMUP"):
+        return None
+    with _WARMUP_LOCK:
+        if _warmup_thread is None:
+            _warmup_thread = Thread(
+                target=_prewarm_whisper,
+                kwargs={
+                    "model_size": model_size or _default_model_size(),
+                    "compute_type": compute_type or _default_compute_type(),
+                },
+                name="bridgecal-stt-warmup",
+                daemon=True,
+            )
+            _warmup_thread.start()
+        return _warmup_thread
+
+
+def _prewarm_whisper(*, model_size: str, compute_type: str) -> None:
+    try:
+        model = _whisper_model(model_size=model_size, compute_type=compute_type)
+        numpy_module = _require_dependency("numpy")
+        # VAD would drop silence before the decoder runs; without it the pass reaches CTranslate2.
+        silence = numpy_module.zeros(
+            int(STT_WARMUP_SECONDS * WHISPER_SAMPLE_RATE), dtype=numpy_module.float32
+        )
+        segments, _ = model.transcribe(silence, language="en", vad_filter=False)
+        for _segment in segments:
+            pass
+    except Exception:
+        logger.debug("Whisper warm-up failed; the first transcription will load it.", exc_info=True)
 
 
 def transcribe_microphone(
     *,
     language: str,
     seconds: float = 7.0,
-    sample_rate: int = 16_000,
+    sample_rate: int = WHISPER_SAMPLE_RATE,
     model_size: str | None = None,
     compute_type: str | None = None,
     stop_event: Event | None = None,
+    on_partial: Callable[[str], None] | None = None,
 ) -> str:
-    audio_path = _record_microphone_to_wav(
-        seconds=seconds,
-        sample_rate=sample_rate,
-        stop_event=stop_event,
-    )
+    _sounddevice_module, numpy_module = _microphone_modules()
+    buffer = _take_record_buffer(numpy_module, int(seconds * sample_rate))
     try:
-        return transcribe_audio_file(
-            audio_path,
+        samples = _record_microphone_to_array(
+            seconds=seconds,
+            sample_rate=sample_rate,
+            stop_event=stop_event,
+            buffer=buffer,
+        )
+        return transcribe_audio_array(
+            samples,
+            sample_rate,
             language=language,
             model_size=model_size,
             compute_type=compute_type,
+            on_partial=on_partial,
         )
     finally:
-        audio_path.unlink(missing_ok=True)
+        # Transcription has consumed the samples by now, so the buffer can serve the next call.
+        _return_record_buffer(buffer)
+
+
+def transcribe_audio_array(
+    samples: Any,
+    sample_rate: int,
+    *,
+    language: str,
+    model_size: str | None = None,
+    compute_type: str | None = None,
+    on_partial: Callable[[str], None] | None = None,
+) -> str:
+    """Transcribe mono float32 samples without going through an audio file."""
+    if sample_rate != WHISPER_SAMPLE_RATE:
+        samples = _resample_to_whisper_rate(samples, sample_rate)
+    return _transcribe(
+        samples,
+        language=language,
+        model_size=model_size,
+        compute_type=compute_type,
+        on_partial=on_partial,
+    )
+
+
+def _resample_to_whisper_rate(samples: Any, sample_rate: int) -> Any:
+    # faster-whisper assumes arrays are already 16 kHz, so conversion happens exactly once here.
+    numpy_module = _require_dependency("numpy")
+    soxr_module = _load_optional_dependency("soxr").module
+    if soxr_module is not None:
+        resampled = soxr_module.resample(samples, sample_rate, WHISPER_SAMPLE_RATE)
+        return numpy_module.asarray(resampled, dtype=numpy_module.float32)
+
+    signal_module = _load_optional_dependency("scipy.signal").module
+    if signal_module is not None:
+        divisor = math.gcd(sample_rate, WHISPER_SAMPLE_RATE)
+        resampled = signal_module.resample_poly(
+            samples, WHISPER_SAMPLE_RATE // divisor, sample_rate // divisor
+        )
+        return numpy_module.asarray(resampled, dtype=numpy_module.float32)
+
+    target_count = int(len(samples) * WHISPER_SAMPLE_RATE / sample_rate)
+    return numpy_module.interp(
+        numpy_module.linspace(0, len(samples), target_count, endpoint=False),
+        numpy_module.arange(len(samples)),
+        samples,
+    ).astype(numpy_module.float32)
 
 
 def transcribe_audio_file(
@@ -53,33 +174,62 @@ def transcribe_audio_file(
     language: str,
     model_size: str | None = None,
     compute_type: str | None = None,
+    on_partial: Callable[[str], None] | None = None,
+) -> str:
+    # faster-whisper decodes and resamples files itself.
+    return _transcribe(
+        str(audio_path),
+        language=language,
+        model_size=model_size,
+        compute_type=compute_type,
+        on_partial=on_partial,
+    )
+
+
+def _transcribe(
+    audio: Any,
+    *,
+    language: str,
+    model_size: str | None,
+    compute_type: str | None,
+    on_partial: Callable[[str], None] | None,
 ) -> str:
     model = _whisper_model(
         model_size=model_size or _default_model_size(),
         compute_type=compute_type or _default_compute_type(),
     )
     segments, _ = model.transcribe(
-        str(audio_path),
+        audio,
         language=language,
         beam_size=5,
         best_of=5,
-        vad_filter=True,
+        vad_filter=_vad_enabled(),
         condition_on_previous_text=False,
     )
-    text_parts = [str(segment.text).strip() for segment in segments if str(segment.text).strip()]
+    # Segments decode lazily; hand each one to the caller as soon as it is ready.
+    text_parts: list[str] = []
+    for segment in segments:
+        raw_text = segment.text
+        piece = (raw_text if isinstance(raw_text, str) else str(raw_text)).strip()
+        if not piece:
+            continue
+        text_parts.append(piece)
+        if on_partial is not None:
+            on_partial(piece)
     text = " ".join(text_parts).strip()
     if not text:
         raise RuntimeError("No speech could be recognized from the recording.")
     return text
 
 
-def _record_microphone_to_wav(
+def _record_microphone_to_array(
     *,
     seconds: float,
     sample_rate: int,
     stop_event: Event | None = None,
-) -> Path:
-    sounddevice_module, soundfile_module = _microphone_modules()
+    buffer: Any | None = None,
+) -> Any:
+    sounddevice_module, numpy_module = _microphone_modules()
     if seconds <= 0:
         raise RuntimeError("Recording duration must be greater than zero.")
     if sample_rate < 8000:
@@ -89,40 +239,53 @@ def _record_microphone_to_wav(
     if frame_count <= 0:
         raise RuntimeError("Recording duration produced zero audio frames.")
 
-    recording = sounddevice_module.rec(
-        frame_count,
+    # PortAudio fills this in place from its callback; an early stop just leaves the tail unused.
+    if buffer is not None and len(buffer) >= frame_count:
+        recording = buffer
+    else:
+        recording = numpy_module.empty(frame_count, dtype=numpy_module.float32)
+    frames_written = 0
+    filled = Event()
+
+    def on_audio(indata: Any, frames: int, _time: Any, _status: Any) -> None:
+        nonlocal frames_written
+        take = min(frames, frame_count - frames_written)
+        if take > 0:
+            recording[frames_written : frames_written + take] = indata[:take, 0]
+            frames_written += take
+        if frames_written >= frame_count:
+            filled.set()
+
+    deadline = time.monotonic() + seconds + RECORDING_GRACE_SECONDS
+    with sounddevice_module.InputStream(
         samplerate=sample_rate,
         channels=1,
         dtype="float32",
-    )
-    frames_to_write = frame_count
-    if stop_event is None:
-        sounddevice_module.wait()
-    else:
-        started_at = time.monotonic()
-        deadline = started_at + seconds
-        while True:
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
+        blocksize=RECORDING_BLOCK_FRAMES,
+        callback=on_audio,
+    ):
+        while not filled.wait(timeout=0.05):
+            if stop_event is not None and stop_event.is_set():
                 break
-            if stop_event.wait(timeout=min(0.05, remaining)):
-                elapsed = max(0.0, time.monotonic() - started_at)
-                frames_to_write = max(1, min(frame_count, int(elapsed * sample_rate)))
-                sounddevice_module.stop()
+            if time.monotonic() >= deadline:
                 break
-        sounddevice_module.wait()
-        if frames_to_write < frame_count:
-            recording = recording[:frames_to_write]
 
-    fd, temp_file_path = tempfile.mkstemp(
-        prefix="bridgecal-voice-",
-        suffix=".wav",
-    )
-    os.close(fd)
-    output_path = Path(temp_file_path)
+    if frames_written <= 0:
+        raise RuntimeError("No speech could be recognized from the recording.")
+    return recording[:frames_written]
 
-    soundfile_module.write(str(output_path), recording, sample_rate)
-    return output_path
+
+def _take_record_buffer(numpy_module: Any, frame_count: int) -> Any:
+    with _RECORD_BUFFER_LOCK:
+        pooled = _RECORD_BUFFERS.pop(frame_count, None)
+    if pooled is not None:
+        return pooled
+    return numpy_module.empty(max(frame_count, 1), dtype=numpy_module.float32)
+
+
+def _return_record_buffer(buffer: Any) -> None:
+    with _RECORD_BUFFER_LOCK:
+        _RECORD_BUFFERS.setdefault(len(buffer), buffer)
 
 
 def _whisper_model(*, model_size: str, compute_type: str) -> Any:
@@ -137,15 +300,74 @@ def _whisper_model(*, model_size: str, compute_type: str) -> Any:
                 raise RuntimeError(
                     "faster-whisper installation is invalid: WhisperModel not found."
                 )
-            model = model_class(
+            cpu_threads = min(os.cpu_count() or 1, STT_MAX_CPU_THREADS)
+            logger.info(
+                "Loading faster-whisper model=%s compute_type=%s cpu_threads=%s",
                 model_size,
-                device="cpu",
-                compute_type=compute_type,
+                compute_type,
+                cpu_threads,
             )
+            try:
+                model = _construct_whisper_model(model_class, model_size, compute_type, cpu_threads)
+            except ValueError as exc:
+                # CTranslate2 rejects compute types this CPU/build cannot run; int8 always works.
+                # Other ValueErrors (e.g. a failed Hub download) are not retried under int8.
+                if compute_type == DEFAULT_STT_COMPUTE_TYPE or "compute type" not in str(exc):
+                    raise
+                logger.warning(
+                    "compute_type=%s is unsupported; falling back to %s",
+                    compute_type,
+                    DEFAULT_STT_COMPUTE_TYPE,
+                )
+                model = _construct_whisper_model(
+                    model_class, model_size, DEFAULT_STT_COMPUTE_TYPE, cpu_threads
+                )
             _MODEL_CACHE[cache_key] = model
+            if _vad_enabled():
+                _preload_vad_model()
     return model
 
 
+def _construct_whisper_model(
+    model_class: Any, model_size: str, compute_type: str, cpu_threads: int
+) -> Any:
+    options = {
+        "device": "cpu",
+        "compute_type": compute_type,
+        "cpu_threads": cpu_threads,
+        "num_workers": 1,
+    }
+    try:
+        # A cached snapshot loads without asking the Hugging Face Hub for a newer revision.
+        return model_class(model_size, local_files_only=True, **options)
+    except _missing_snapshot_errors():
+        logger.debug("No local Whisper snapshot for %s; downloading.", model_size, exc_info=True)
+    return model_class(model_size, **options)
+
+
+def _missing_snapshot_errors() -> tuple[type[Exception], ...]:
+    # huggingface_hub arrives with faster-whisper; older releases do not derive this from OSError.
+    try:
+        hub_utils = import_module("huggingface_hub.utils")
+    except ImportError:
+        return (FileNotFoundError,)
+    local_entry_error = getattr(hub_utils, "LocalEntryNotFoundError", None)
+    if isinstance(local_entry_error, type) and issubclass(local_entry_error, Exception):
+        return (FileNotFoundError, local_entry_error)
+    return (FileNotFoundError,)
+
+
+def _preload_vad_model() -> None:
+    # faster-whisper loads Silero VAD lazily on the first vad_filter pass; do it with the model.
+    try:
+        vad_module = import_module("faster_whisper.vad")
+        get_vad_model = getattr(vad_module, "get_vad_model", None)
+        if get_vad_model is not None:
+            get_vad_model()
+    except Exception:
+        logger.debug("Silero VAD preload failed; it will load on first use.", exc_info=True)
+
+
 def _default_model_size() -> str:
     value = os.environ.get("BRIDGECAL_STT_MODEL", "").strip()
     return value or "small"
@@ -153,13 +375,23 @@ def _default_model_size() -> str:
 
 def _default_compute_type() -> str:
     value = os.environ.get("BRIDGECAL_STT_COMPUTE_TYPE", "").strip()
-    return value or "int8"
+    return value or DEFAULT_STT_COMPUTE_TYPE
+
+
+def _vad_enabled() -> bool:
+    # BRIDGECAL_STT_VAD=0 skips the VAD pass, which buys nothing on short commands.
+    value = os.environ.get("BRIDGECAL_STT_VAD", "").strip().lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def _read_env_bool(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in {"1", "true", "yes", "on"}
 
 
 def _microphone_modules() -> tuple[Any, Any]:
     sounddevice_module = _require_dependency("sounddevice")
-    soundfile_module = _require_dependency("soundfile")
-    return sounddevice_module, soundfile_module
+    numpy_module = _require_dependency("numpy")
+    return sounddevice_module, numpy_module
 
 
 def _require_dependency(module_name: str) -> Any:
@@ -186,24 +418,48 @@ def _require_dependency(module_name: str) -> Any:
     raise RuntimeError(f"{message} {detail} {dependency_guidance}".strip())
 
 
+@lru_cache(maxsize=32)
+def _module_available(module_name: str) -> bool:
+    # Installed packages do not change while the process runs; skip repeated path scans.
+    try:
+        return util.find_spec(module_name) is not None
+    except ModuleNotFoundError:
+        # Dotted names raise instead of returning None when the parent package is missing.
+        return False
+
+
 def _load_optional_dependency(module_name: str) -> _DependencyLoadResult:
-    if util.find_spec(module_name) is None:
+    if not _module_available(module_name):
         return _DependencyLoadResult(module=None)
 
+    # The lock only guards the cache dict; the import itself runs outside it so a slow
+    # load (torch via faster_whisper) does not block unrelated modules.
     with _DEPENDENCY_LOCK:
-        cached = _DEPENDENCY_CACHE.get(module_name)
-        if cached is not None:
-            return cached
-
-        try:
-            module = import_module(module_name)
-        except Exception as exc:
-            loaded = _DependencyLoadResult(module=None, error=exc)
-        else:
-            loaded = _DependencyLoadResult(module=module)
-
-        _DEPENDENCY_CACHE[module_name] = loaded
-        return loaded
+        state = _DEPENDENCY_CACHE.get(module_name)
+        owner = state is None
+        if state is None:
+            state = _DependencyLoadState()
+            _DEPENDENCY_CACHE[module_name] = state
+
+    if not owner:
+        state.ready.wait()
+        assert state.result is not None
+        return state.result
+
+    try:
+        module = import_module(module_name)
+    except Exception as exc:
+        state.result = _DependencyLoadResult(module=None, error=exc)
+    else:
+        state.result = _DependencyLoadResult(module=module)
+    finally:
+        if state.result is None:
+            # BaseException escaped the import; let the next caller retry.
+            with _DEPENDENCY_LOCK:
+                _DEPENDENCY_CACHE.pop(module_name, None)
+            state.result = _DependencyLoadResult(module=None)
+        state.ready.set()
+    return state.result
 
 
 def _format_dependency_error(module_name: str, error: Exception | None) -> str:
@@ -3,10 +3,24 @@ from __future__ import annotations
 import base64
 import subprocess
 import sys
+import time
 from dataclasses import dataclass
+from functools import lru_cache
+from importlib import import_module
 from pathlib import Path
+from threading import Lock
+from typing import Any
 
 TASK_NAME = "BridgeCal Sync Agent"
+# Repeated status polls inside this window reuse the last answer instead of querying again.
+SCHEDULER_STATUS_TTL_SECONDS = 2.0
+# Task Scheduler TASK_STATE values, named like PowerShell's ScheduledTaskState.
+TASK_STATE_NAMES = {0: "Unknown", 1: "Disabled", 2: "Queued", 3: "Ready", 4: "Running"}
+# HRESULT_FROM_WIN32(ERROR_FILE_NOT_FOUND), raised by ITaskFolder.GetTask for a missing task.
+TASK_NOT_FOUND_HRESULT = -2147024894
+
+_STATUS_CACHE: dict[str, tuple[float, str]] = {}
+_STATUS_CACHE_LOCK = Lock()
 
 
 @dataclass(frozen=True)
@@ -20,6 +34,8 @@ def _ps_single_quoted(value: str) -> str:
     return "'" + value.replace("'", "''") + "'"
 
 
+# The install layout does not change while the process runs, so lookups are memoized.
+@lru_cache(maxsize=4)
 def find_repo_root(start: Path | None = None) -> Path | None:
     probe = start or Path(__file__).resolve()
     if probe.is_file():
@@ -33,6 +49,7 @@ def find_repo_root(start: Path | None = None) -> Path | None:
     return None
 
 
+@lru_cache(maxsize=4)
 def find_runner_script(repo_root: Path | None = None) -> Path | None:
     root = repo_root or find_repo_root()
     if root is None:
@@ -63,7 +80,7 @@ $runnerPath = {runner_literal}
 $configPath = {config_literal}
 $intervalSeconds = {interval_seconds}
 
-$psExe = (Get-Command powershell.exe).Source
+$psExe = Join-Path $env:SystemRoot 'System32\\WindowsPowerShell\\v1.0\\powershell.exe'
 $taskArgs = "-NoProfile -ExecutionPolicy Bypass -File `"$runnerPath`" -IntervalSeconds $intervalSeconds -ConfigPath `"$configPath`""
 $currentUser = [System.Security.Principal.WindowsIdentity]::GetCurrent().Name
 
@@ -77,6 +94,7 @@ Write-Output "Scheduled task configured: $taskName"
 """.strip()
 
 
+@lru_cache(maxsize=4)
 def build_remove_task_script(task_name: str = TASK_NAME) -> str:
     task_literal = _ps_single_quoted(task_name)
     return f"""
@@ -179,18 +197,75 @@ def configure_scheduler_with_elevation(
         interval_seconds=interval_seconds,
         task_name=task_name,
     )
-    return run_elevated_powershell(script)
+    result = run_elevated_powershell(script)
+    _clear_scheduler_status_cache()
+    return result
 
 
 def remove_scheduler_with_elevation(task_name: str = TASK_NAME) -> SchedulerOperationResult:
     script = build_remove_task_script(task_name=task_name)
-    return run_elevated_powershell(script)
+    result = run_elevated_powershell(script)
+    _clear_scheduler_status_cache()
+    return result
 
 
 def query_scheduler_status(task_name: str = TASK_NAME) -> str:
     if sys.platform != "win32":
         return "Unsupported OS"
 
+    now = time.monotonic()
+    with _STATUS_CACHE_LOCK:
+        cached = _STATUS_CACHE.get(task_name)
+    if cached is not None and now - cached[0] < SCHEDULER_STATUS_TTL_SECONDS:
+        return cached[1]
+
+    status = _com_status(task_name) or _powershell_status(task_name)
+    with _STATUS_CACHE_LOCK:
+        _STATUS_CACHE[task_name] = (now, status)
+    return status
+
+
+def _clear_scheduler_status_cache() -> None:
+    with _STATUS_CACHE_LOCK:
+        _STATUS_CACHE.clear()
+
+
+def _com_status(task_name: str) -> str | None:
+    # The Task Scheduler COM API answers in-process and reports the state as a number, so
+    # the result does not depend on the Windows display language.
+    modules = _load_com_modules()
+    if modules is None:
+        return None
+    pythoncom, win32_client = modules
+    try:
+        pythoncom.CoInitialize()
+    except pythoncom.com_error:
+        return None
+    try:
+        service = win32_client.Dispatch("Schedule.Service")
+        service.Connect()
+        try:
+            task = service.GetFolder("\\").GetTask(task_name)
+        except pythoncom.com_error as exc:
+            if getattr(exc, "hresult", None) == TASK_NOT_FOUND_HRESULT:
+                return "Not configured"
+            return None
+        return f"Configured ({TASK_STATE_NAMES.get(int(task.State), 'Unknown')})"
+    except pythoncom.com_error:
+        return None
+    finally:
+        pythoncom.CoUninitialize()
+
+
+def _load_com_modules() -> tuple[Any, Any] | None:
+    # pywin32 is optional; without it status queries go through PowerShell.
+    try:
+        return import_module("pythoncom"), import_module("win32com.client")
+    except ImportError:
+        return None
+
+
+def _powershell_status(task_name: str) -> str:
     task_literal = _ps_single_quoted(task_name)
     command = f"""
 $task = Get-ScheduledTask -TaskName {task_literal} -ErrorAction SilentlyContinue
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from concurrent.futures import CancelledError
 from datetime import UTC, datetime, timedelta, timezone
+from threading import Event
 from types import SimpleNamespace
 from typing import Literal
 
@@ -176,6 +178,26 @@ def test_parse_natural_time_range_raises_when_lfm_output_is_invalid(
         parse_natural_time_range("明日の10時から17時", now=now, preferred_language="ja")
 
 
+def test_parse_natural_time_range_stops_before_generation_when_cancelled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail_pipeline(**_: object) -> object:
+        raise AssertionError("pipeline should not load after cancellation")
+
+    monkeypatch.setattr(availability_module, "_lfm_transformers_pipeline", fail_pipeline)
+    cancel_event = Event()
+    cancel_event.set()
+    now = datetime(2026, 2, 17, 8, 0, tzinfo=timezone(timedelta(hours=9)))
+
+    with pytest.raises(CancelledError):
+        parse_natural_time_range(
+            "明日の10時から17時",
+            now=now,
+            preferred_language="ja",
+            cancel_event=cancel_event,
+        )
+
+
 def test_parse_natural_time_range_requires_transformers(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+import sqlite3
 import tempfile
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import replace
 from datetime import UTC, datetime, timedelta
+from functools import cache
 from pathlib import Path
 
+import pytest
+
 from bridgecal.sync.engine import SyncEngine
-from bridgecal.sync.mapping import MappingStore
-from bridgecal.sync.models import CanonicalEvent, EventTime, Origin, compute_fingerprint
+from bridgecal.sync.mapping import MEMORY_DB, MappingRow, MappingStore
+from bridgecal.sync.models import (
+    FINGERPRINT_SCHEME,
+    CanonicalEvent,
+    EventTime,
+    Origin,
+    compute_fingerprint,
+)
 
 BASE = datetime(2026, 2, 16, 9, 0, tzinfo=UTC)
 
 
+# Events are frozen, so identical shapes can share one instance and one fingerprint pass.
+@cache
 def _timed_event(
     *,
     origin: Origin,
@@ -43,108 +56,151 @@ def _timed_event(
 class FakeOutlook:
     def __init__(self, events: list[CanonicalEvent]) -> None:
         self.events: dict[str, CanonicalEvent] = {event.source_id: event for event in events}
+        # (mirror_origin, mirror_source_id) -> source_id, so upserts avoid scanning events.
+        self._by_mirror: dict[tuple[str, str], str] = {
+            (event.mirror_origin, event.mirror_source_id): event.source_id
+            for event in events
+            if event.mirror_origin
+        }
+        self._listing: list[CanonicalEvent] = []
+        self._listing_dirty = True
         self.upserted_from: list[str] = []
         self.deleted: list[str] = []
 
     def list_events(self, window_start: datetime, window_end: datetime) -> list[CanonicalEvent]:
-        return list(self.events.values())
+        # The engine only iterates the listing, so it is rebuilt only after a mutation.
+        if self._listing_dirty:
+            self._listing = list(self.events.values())
+            self._listing_dirty = False
+        return self._listing
+
+    def put_event(self, event: CanonicalEvent) -> None:
+        self.remove_event(event.source_id)
+        self.events[event.source_id] = event
+        if event.mirror_origin:
+            self._by_mirror[(event.mirror_origin, event.mirror_source_id)] = event.source_id
+        self._listing_dirty = True
+
+    def remove_event(self, source_id: str) -> None:
+        removed = self.events.pop(source_id, None)
+        if removed is not None and removed.mirror_origin:
+            self._by_mirror.pop((removed.mirror_origin, removed.mirror_source_id), None)
+        self._listing_dirty = True
 
     def upsert_mirror(self, source: CanonicalEvent) -> str:
         self.upserted_from.append(source.source_id)
-        for existing in self.events.values():
-            if existing.mirror_origin == "google" and existing.mirror_source_id == source.source_id:
-                updated = _timed_event(
-                    origin="outlook",
-                    source_id=existing.source_id,
-                    summary=source.summary,
-                    start_offset_hours=int((source.time.start_dt or BASE).hour - BASE.hour),
-                    mirror_origin="google",
-                    mirror_source_id=source.source_id,
-                )
-                self.events[existing.source_id] = updated
-                return existing.source_id
-
-        mirror_id = f"om-{source.source_id}"
-        created = _timed_event(
-            origin="outlook",
-            source_id=mirror_id,
-            summary=source.summary,
-            start_offset_hours=int((source.time.start_dt or BASE).hour - BASE.hour),
-            mirror_origin="google",
-            mirror_source_id=source.source_id,
+        mirror_id = self._by_mirror.get(("google", source.source_id), f"om-{source.source_id}")
+        self.put_event(
+            _timed_event(
+                origin="outlook",
+                source_id=mirror_id,
+                summary=source.summary,
+                start_offset_hours=int((source.time.start_dt or BASE).hour - BASE.hour),
+                mirror_origin="google",
+                mirror_source_id=source.source_id,
+            )
         )
-        self.events[mirror_id] = created
         return mirror_id
 
     def delete_event(self, outlook_id: str) -> None:
         self.deleted.append(outlook_id)
-        self.events.pop(outlook_id, None)
+        self.remove_event(outlook_id)
 
 
 class FakeGoogle:
     def __init__(self, events: list[CanonicalEvent]) -> None:
         self.events: dict[str, CanonicalEvent] = {event.source_id: event for event in events}
+        # (mirror_origin, mirror_source_id) -> source_id, so upserts avoid scanning events.
+        self._by_mirror: dict[tuple[str, str], str] = {
+            (event.mirror_origin, event.mirror_source_id): event.source_id
+            for event in events
+            if event.mirror_origin
+        }
+        self._listing: list[CanonicalEvent] = []
+        self._listing_dirty = True
         self.upserted_from: list[str] = []
         self.deleted: list[str] = []
+        self.failing_deletes: set[str] = set()
 
     def list_events(self, window_start: datetime, window_end: datetime) -> list[CanonicalEvent]:
-        return list(self.events.values())
+        # The engine only iterates the listing, so it is rebuilt only after a mutation.
+        if self._listing_dirty:
+            self._listing = list(self.events.values())
+            self._listing_dirty = False
+        return self._listing
+
+    def put_event(self, event: CanonicalEvent) -> None:
+        self.remove_event(event.source_id)
+        self.events[event.source_id] = event
+        if event.mirror_origin:
+            self._by_mirror[(event.mirror_origin, event.mirror_source_id)] = event.source_id
+        self._listing_dirty = True
+
+    def remove_event(self, source_id: str) -> None:
+        removed = self.events.pop(source_id, None)
+        if removed is not None and removed.mirror_origin:
+            self._by_mirror.pop((removed.mirror_origin, removed.mirror_source_id), None)
+        self._listing_dirty = True
 
     def upsert_mirror(self, source: CanonicalEvent) -> str:
         self.upserted_from.append(source.source_id)
-        for existing in self.events.values():
-            if (
-                existing.mirror_origin == "outlook"
-                and existing.mirror_source_id == source.source_id
-            ):
-                updated = _timed_event(
-                    origin="google",
-                    source_id=existing.source_id,
-                    summary=source.summary,
-                    start_offset_hours=int((source.time.start_dt or BASE).hour - BASE.hour),
-                    mirror_origin="outlook",
-                    mirror_source_id=source.source_id,
-                )
-                self.events[existing.source_id] = updated
-                return existing.source_id
-
-        mirror_id = f"gm-{source.source_id}"
-        created = _timed_event(
-            origin="google",
-            source_id=mirror_id,
-            summary=source.summary,
-            start_offset_hours=int((source.time.start_dt or BASE).hour - BASE.hour),
-            mirror_origin="outlook",
-            mirror_source_id=source.source_id,
+        mirror_id = self._by_mirror.get(("outlook", source.source_id), f"gm-{source.source_id}")
+        self.put_event(
+            _timed_event(
+                origin="google",
+                source_id=mirror_id,
+                summary=source.summary,
+                start_offset_hours=int((source.time.start_dt or BASE).hour - BASE.hour),
+                mirror_origin="outlook",
+                mirror_source_id=source.source_id,
+            )
         )
-        self.events[mirror_id] = created
         return mirror_id
 
+    def upsert_mirrors(
+        self,
+        sources: Sequence[CanonicalEvent],
+        on_upserted: Callable[[CanonicalEvent, str], None],
+    ) -> None:
+        for source in sources:
+            on_upserted(source, self.upsert_mirror(source))
+
     def delete_event(self, google_event_id: str) -> None:
         self.deleted.append(google_event_id)
-        self.events.pop(google_event_id, None)
+        self.remove_event(google_event_id)
+
+    def delete_events(self, google_event_ids: Sequence[str]) -> set[str]:
+        gone: set[str] = set()
+        for google_event_id in google_event_ids:
+            if google_event_id in self.failing_deletes:
+                continue
+            self.delete_event(google_event_id)
+            gone.add(google_event_id)
+        return gone
+
+
+@pytest.fixture
+def store() -> Iterator[MappingStore]:
+    # An in-memory database skips the temp directory and file I/O for each test.
+    store = MappingStore(MEMORY_DB)
+    yield store
+    store.close()
 
 
 def _engine_with_store(
+    store: MappingStore,
     outlook_events: list[CanonicalEvent],
     google_events: list[CanonicalEvent],
-) -> tuple[
-    SyncEngine,
-    MappingStore,
-    FakeOutlook,
-    FakeGoogle,
-    tempfile.TemporaryDirectory[str],
-]:
-    tempdir = tempfile.TemporaryDirectory()
-    store = MappingStore(Path(tempdir.name) / "state.db")
+) -> tuple[SyncEngine, FakeOutlook, FakeGoogle]:
     outlook = FakeOutlook(outlook_events)
     google = FakeGoogle(google_events)
     engine = SyncEngine(outlook, google, store)
-    return engine, store, outlook, google, tempdir
+    return engine, outlook, google
 
 
-def test_loop_prevention_skips_mirror_items() -> None:
-    engine, store, outlook, google, tempdir = _engine_with_store(
+def test_loop_prevention_skips_mirror_items(store: MappingStore) -> None:
+    engine, outlook, google = _engine_with_store(
+        store,
         outlook_events=[
             _timed_event(
                 origin="outlook", source_id="o-src", summary="Outlook source", start_offset_hours=1
@@ -172,21 +228,18 @@ def test_loop_prevention_skips_mirror_items() -> None:
             ),
         ],
     )
-    try:
-        stats = engine.run_once(past_days=1, future_days=1, now=BASE)
+    stats = engine.run_once(past_days=1, future_days=1, now=BASE)
 
-        assert stats.created_in_google == 1
-        assert stats.created_in_outlook == 1
-        assert outlook.upserted_from == ["g-src"]
-        assert google.upserted_from == ["o-src"]
-        assert len(store.list_all()) == 2
-    finally:
-        store.close()
-        tempdir.cleanup()
+    assert stats.created_in_google == 1
+    assert stats.created_in_outlook == 1
+    assert outlook.upserted_from == ["g-src"]
+    assert google.upserted_from == ["o-src"]
+    assert len(store.list_all()) == 2
 
 
-def test_create_update_delete_both_directions() -> None:
-    engine, store, outlook, google, tempdir = _engine_with_store(
+def test_create_update_delete_both_directions(store: MappingStore) -> None:
+    engine, outlook, google = _engine_with_store(
+        store,
         outlook_events=[
             _timed_event(
                 origin="outlook", source_id="o1", summary="Outlook A", start_offset_hours=1
@@ -196,45 +249,48 @@ def test_create_update_delete_both_directions() -> None:
             _timed_event(origin="google", source_id="g1", summary="Google A", start_offset_hours=2),
         ],
     )
-    try:
-        first = engine.run_once(past_days=1, future_days=1, now=BASE)
-        assert first.created_in_google == 1
-        assert first.created_in_outlook == 1
-        assert len(store.list_all()) == 2
+    first = engine.run_once(past_days=1, future_days=1, now=BASE)
+    assert first.created_in_google == 1
+    assert first.created_in_outlook == 1
+    assert len(store.list_all()) == 2
 
-        outlook.events["o1"] = _timed_event(
+    outlook.put_event(
+        _timed_event(
             origin="outlook",
             source_id="o1",
             summary="Outlook Updated",
             start_offset_hours=1,
             last_modified_offset_minutes=15,
         )
-        google.events["g1"] = _timed_event(
+    )
+    google.put_event(
+        _timed_event(
             origin="google",
             source_id="g1",
             summary="Google Updated",
             start_offset_hours=2,
             last_modified_offset_minutes=20,
         )
+    )
 
-        second = engine.run_once(past_days=1, future_days=1, now=BASE)
-        assert second.updated_in_google == 1
-        assert second.updated_in_outlook == 1
+    second = engine.run_once(past_days=1, future_days=1, now=BASE)
+    assert second.updated_in_google == 1
+    assert second.updated_in_outlook == 1
 
-        outlook.events.pop("o1")
-        google.events.pop("g1")
+    outlook.remove_event("o1")
+    google.remove_event("g1")
 
-        third = engine.run_once(past_days=1, future_days=1, now=BASE)
-        assert third.deleted_in_google == 1
-        assert third.deleted_in_outlook == 1
-        assert store.list_all() == []
-    finally:
-        store.close()
-        tempdir.cleanup()
+    third = engine.run_once(past_days=1, future_days=1, now=BASE)
+    assert third.deleted_in_google == 1
+    assert third.deleted_in_outlook == 1
+    assert store.list_all() == []
 
 
-def test_idempotent_on_second_run_without_changes() -> None:
-    engine, store, outlook, google, tempdir = _engine_with_store(
+def test_idempotent_on_second_run_without_changes(
+    store: MappingStore, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine, outlook, google = _engine_with_store(
+        store,
         outlook_events=[
             _timed_event(origin="outlook", source_id="o1", summary="Outlook", start_offset_hours=1),
         ],
@@ -242,28 +298,130 @@ def test_idempotent_on_second_run_without_changes() -> None:
             _timed_event(origin="google", source_id="g1", summary="Google", start_offset_hours=2),
         ],
     )
+    first = engine.run_once(past_days=1, future_days=1, now=BASE)
+    assert first.created_in_google == 1
+    assert first.created_in_outlook == 1
+
+    upserts_outlook_before = len(outlook.upserted_from)
+    upserts_google_before = len(google.upserted_from)
+    deletes_outlook_before = len(outlook.deleted)
+    deletes_google_before = len(google.deleted)
+
+    second = engine.run_once(past_days=1, future_days=1, now=BASE)
+
+    assert second.created_in_google == 0
+    assert second.updated_in_google == 0
+    assert second.deleted_in_google == 0
+    assert second.created_in_outlook == 0
+    assert second.updated_in_outlook == 0
+    assert second.deleted_in_outlook == 0
+    assert len(outlook.upserted_from) == upserts_outlook_before
+    assert len(google.upserted_from) == upserts_google_before
+    assert len(outlook.deleted) == deletes_outlook_before
+    assert len(google.deleted) == deletes_google_before
+
+    # Once both sides have a baseline, an unchanged pass rewrites no mapping rows either.
+    mapping_writes: list[MappingRow] = []
+    monkeypatch.setattr(store, "upsert", mapping_writes.append)
+    engine.run_once(past_days=1, future_days=1, now=BASE)
+    assert mapping_writes == []
+
+
+def test_mapping_store_drops_fingerprints_from_another_scheme() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "state.db"
+        store = MappingStore(db_path)
+        store.upsert(
+            MappingRow(
+                outlook_id="o1",
+                google_id="g1",
+                origin="outlook",
+                last_outlook_fp="old-outlook",
+                last_google_fp="old-google",
+                last_outlook_modified="2026-02-16T09:00:00+00:00",
+            )
+        )
+        store.kv_set("fp_algo", "sha256")
+        store.close()
+
+        reopened = MappingStore(db_path)
+        try:
+            row = reopened.get_by_outlook("o1")
+            assert row is not None
+            assert row.last_outlook_fp == ""
+            assert row.last_google_fp == ""
+            assert row.last_outlook_modified == "2026-02-16T09:00:00+00:00"
+            assert reopened.kv_get("fp_algo") == FINGERPRINT_SCHEME
+        finally:
+            reopened.close()
+
+
+def test_mapping_store_batch_commits_once_on_exit() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "state.db"
+        store = MappingStore(db_path)
+        observer = sqlite3.connect(db_path)
+        try:
+            with store:
+                store.upsert(MappingRow(outlook_id="o1", google_id="g1", origin="outlook"))
+                store.upsert(MappingRow(outlook_id="o2", google_id="g2", origin="outlook"))
+                assert observer.execute("SELECT COUNT(*) FROM mapping").fetchone()[0] == 0
+            assert observer.execute("SELECT COUNT(*) FROM mapping").fetchone()[0] == 2
+        finally:
+            observer.close()
+            store.close()
+
+
+def test_mapping_store_queued_upserts_stay_ordered_with_deletes() -> None:
+    store = MappingStore(MEMORY_DB)
+    try:
+        with store:
+            store.upsert_many(
+                [
+                    MappingRow(outlook_id="o1", google_id="g1", origin="outlook"),
+                    MappingRow(outlook_id="o2", google_id="g2", origin="google"),
+                ]
+            )
+            store.delete_pair("o1", "g1")
+            store.upsert(MappingRow(outlook_id="o1", google_id="g1b", origin="outlook"))
+            assert store.get_by_google("g2") is not None
+        assert sorted(row.google_id for row in store.list_all()) == ["g1b", "g2"]
+    finally:
+        store.close()
+
+
+def test_mapping_store_looks_up_google_id_by_index() -> None:
+    store = MappingStore(MEMORY_DB)
     try:
-        first = engine.run_once(past_days=1, future_days=1, now=BASE)
-        assert first.created_in_google == 1
-        assert first.created_in_outlook == 1
-
-        upserts_outlook_before = len(outlook.upserted_from)
-        upserts_google_before = len(google.upserted_from)
-        deletes_outlook_before = len(outlook.deleted)
-        deletes_google_before = len(google.deleted)
-
-        second = engine.run_once(past_days=1, future_days=1, now=BASE)
-
-        assert second.created_in_google == 0
-        assert second.updated_in_google == 0
-        assert second.deleted_in_google == 0
-        assert second.created_in_outlook == 0
-        assert second.updated_in_outlook == 0
-        assert second.deleted_in_outlook == 0
-        assert len(outlook.upserted_from) == upserts_outlook_before
-        assert len(google.upserted_from) == upserts_google_before
-        assert len(outlook.deleted) == deletes_outlook_before
-        assert len(google.deleted) == deletes_google_before
+        plan = store._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM mapping WHERE google_id = ?", ("g1",)
+        ).fetchall()
+        assert any("idx_mapping_google" in str(tuple(step)) for step in plan)
     finally:
         store.close()
-        tempdir.cleanup()
+
+
+def test_failed_google_deletes_keep_their_pairs_for_retry(store: MappingStore) -> None:
+    engine, outlook, google = _engine_with_store(
+        store,
+        outlook_events=[
+            _timed_event(origin="outlook", source_id="o1", summary="A", start_offset_hours=1),
+            _timed_event(origin="outlook", source_id="o2", summary="B", start_offset_hours=2),
+        ],
+        google_events=[],
+    )
+    engine.run_once(past_days=1, future_days=1, now=BASE)
+    outlook.remove_event("o1")
+    outlook.remove_event("o2")
+    google.failing_deletes.add("gm-o2")
+
+    partial = engine.run_once(past_days=1, future_days=1, now=BASE)
+
+    assert partial.deleted_in_google == 1
+    assert [(row.outlook_id, row.google_id) for row in store.list_all()] == [("o2", "gm-o2")]
+
+    google.failing_deletes.clear()
+    retry = engine.run_once(past_days=1, future_days=1, now=BASE)
+
+    assert retry.deleted_in_google == 1
+    assert store.list_all() == []
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import json
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
+from zoneinfo import ZoneInfo
 
 import pytest
 
@@ -13,6 +15,60 @@ from bridgecal.google_client import (
     _load_json_object,
     _validate_desktop_client_secret_config,
 )
+from bridgecal.sync.models import CanonicalEvent, EventTime
+
+_DESKTOP_CLIENT_SECRET_JSON = json.dumps(
+    {
+        "installed": {
+            "client_id": "id",
+            "client_secret": "secret",
+            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+            "token_uri": "https://oauth2.googleapis.com/token",
+            "redirect_uris": ["http://localhost"],
+        }
+    }
+).encode("utf-8")
+
+
+class FakeCreds:
+    def __init__(self) -> None:
+        self.valid = True
+
+    def to_json(self) -> str:
+        return '{"token": "x"}'
+
+
+class FakeFlow:
+    def __init__(self) -> None:
+        self.oauth2session = SimpleNamespace(verify=True)
+        self.ran = False
+
+    def run_local_server(self, port: int = 0) -> FakeCreds:
+        assert port == 0
+        self.ran = True
+        return FakeCreds()
+
+
+def _install_fake_google_oauth(monkeypatch: pytest.MonkeyPatch) -> FakeFlow:
+    fake_flow = FakeFlow()
+
+    class FakeInstalledAppFlow:
+        @staticmethod
+        def from_client_config(client_config: dict[str, Any], scopes: list[str]) -> FakeFlow:
+            assert client_config["installed"]["client_id"] == "id"
+            assert scopes == ["https://www.googleapis.com/auth/calendar"]
+            return fake_flow
+
+    monkeypatch.setattr(
+        google_client_module,
+        "google_oauth_flow",
+        SimpleNamespace(InstalledAppFlow=FakeInstalledAppFlow),
+    )
+    monkeypatch.setattr(
+        google_client_module, "google_credentials", SimpleNamespace(Credentials=SimpleNamespace())
+    )
+    monkeypatch.setattr(google_client_module, "google_requests", object())
+    return fake_flow
 
 
 def test_load_json_object_rejects_utf8_bom(tmp_path: Path) -> None:
@@ -83,35 +139,7 @@ def test_google_client_disables_oauth_session_verify_in_insecure_mode(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    class FakeCreds:
-        def __init__(self) -> None:
-            self.valid = True
-
-        def to_json(self) -> str:
-            return json.dumps({"token": "x"})
-
-    class FakeFlow:
-        def __init__(self) -> None:
-            self.oauth2session = SimpleNamespace(verify=True)
-            self.ran = False
-
-        def run_local_server(self, port: int = 0) -> FakeCreds:
-            assert port == 0
-            self.ran = True
-            return FakeCreds()
-
-    fake_flow = FakeFlow()
-
-    class FakeInstalledAppFlow:
-        @staticmethod
-        def from_client_config(client_config: dict[str, Any], scopes: list[str]) -> FakeFlow:
-            assert client_config["installed"]["client_id"] == "id"
-            assert scopes == ["https://www.googleapis.com/auth/calendar"]
-            return fake_flow
-
-    fake_google_oauth_flow = SimpleNamespace(InstalledAppFlow=FakeInstalledAppFlow)
-    fake_google_credentials = SimpleNamespace(Credentials=SimpleNamespace())
-    fake_google_requests = object()
+    fake_flow = _install_fake_google_oauth(monkeypatch)
     warnings_called = {"value": False}
 
     def fake_disable_warnings(_: Any) -> None:
@@ -121,27 +149,10 @@ def test_google_client_disables_oauth_session_verify_in_insecure_mode(
         exceptions=SimpleNamespace(InsecureRequestWarning=RuntimeWarning),
         disable_warnings=fake_disable_warnings,
     )
-
-    monkeypatch.setattr(google_client_module, "google_oauth_flow", fake_google_oauth_flow)
-    monkeypatch.setattr(google_client_module, "google_credentials", fake_google_credentials)
-    monkeypatch.setattr(google_client_module, "google_requests", fake_google_requests)
     monkeypatch.setattr(google_client_module, "urllib3", fake_urllib3)
 
     client_secret_path = tmp_path / "google_client_secret.json"
-    client_secret_path.write_text(
-        json.dumps(
-            {
-                "installed": {
-                    "client_id": "id",
-                    "client_secret": "secret",
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "redirect_uris": ["http://localhost"],
-                }
-            }
-        ),
-        encoding="utf-8",
-    )
+    client_secret_path.write_bytes(_DESKTOP_CLIENT_SECRET_JSON)
 
     token_path = tmp_path / "google_token.json"
     client = GoogleClient(
@@ -174,5 +185,139 @@ def test_google_event_time_uses_timezone_field_when_offset_missing() -> None:
 
     assert event_time.start_dt is not None
     assert event_time.end_dt is not None
-    assert event_time.start_dt.isoformat() == "2026-02-18T09:30:00+09:00"
-    assert event_time.end_dt.isoformat() == "2026-02-18T10:30:00+09:00"
+    tokyo = ZoneInfo("Asia/Tokyo")
+    assert event_time.start_dt == datetime(2026, 2, 18, 9, 30, tzinfo=tokyo)
+    assert event_time.end_dt == datetime(2026, 2, 18, 10, 30, tzinfo=tokyo)
+    # Datetime equality compares instants, so check the wall-clock offset separately.
+    assert event_time.start_dt.utcoffset() == timedelta(hours=9)
+
+
+def test_upsert_mirrors_batches_lookups_and_writes() -> None:
+    class FakeRequest:
+        def __init__(self, result: dict[str, Any]) -> None:
+            self.result = result
+
+        def execute(self) -> dict[str, Any]:
+            return self.result
+
+    class FakeBatch:
+        def __init__(self, callback: Any) -> None:
+            self.callback = callback
+            self.requests: list[tuple[str, FakeRequest]] = []
+
+        def add(self, request: FakeRequest, request_id: str) -> None:
+            self.requests.append((request_id, request))
+
+        def execute(self) -> None:
+            executed_batches.append(len(self.requests))
+            for request_id, request in self.requests:
+                self.callback(request_id, request.execute(), None)
+
+    class FakeEvents:
+        def list(self, **kwargs: Any) -> FakeRequest:
+            outlook_id = kwargs["privateExtendedProperty"][1].split("=", 1)[1]
+            items = [{"id": "existing"}] if outlook_id == "o-known" else []
+            return FakeRequest({"items": items})
+
+        def patch(self, **kwargs: Any) -> FakeRequest:
+            return FakeRequest({"id": kwargs["eventId"]})
+
+        def insert(self, **kwargs: Any) -> FakeRequest:
+            return FakeRequest({"id": "new-" + kwargs["body"]["summary"]})
+
+    class FakeService:
+        def events(self) -> FakeEvents:
+            return FakeEvents()
+
+        def new_batch_http_request(self, callback: Any) -> FakeBatch:
+            return FakeBatch(callback)
+
+    executed_batches: list[int] = []
+    client = GoogleClient(
+        calendar_id="primary",
+        client_secret_path=Path("secret.json"),
+        token_path=Path("token.json"),
+    )
+    client._service = FakeService()
+    sources = [
+        CanonicalEvent(
+            origin="outlook",
+            source_id=source_id,
+            time=EventTime(start_date=date(2026, 2, 18)),
+            summary=source_id,
+        )
+        for source_id in ("o-known", "o-new")
+    ]
+    results: dict[str, str] = {}
+
+    client.upsert_mirrors(
+        sources, lambda source, google_id: results.update({source.source_id: google_id})
+    )
+
+    assert results == {"o-known": "existing", "o-new": "new-o-new"}
+    assert executed_batches == [2, 2]
+
+
+def _http_error(status: int) -> Exception:
+    errors_module = google_client_module.google_errors
+    assert errors_module is not None
+    error: Exception = errors_module.HttpError(SimpleNamespace(status=status, reason="x"), b"{}")
+    return error
+
+
+class _FakeDeleteBatch:
+    def __init__(self, callback: Any, outcomes: dict[str, Exception | None]) -> None:
+        self.callback = callback
+        self.outcomes = outcomes
+        self.request_ids: list[str] = []
+
+    def add(self, _request: Any, request_id: str) -> None:
+        # BatchHttpRequest.add raises KeyError for a repeated request_id.
+        if request_id in self.request_ids:
+            raise KeyError(request_id)
+        self.request_ids.append(request_id)
+
+    def execute(self) -> None:
+        for request_id in self.request_ids:
+            self.callback(request_id, None, self.outcomes.get(request_id))
+
+
+def _client_with_delete_outcomes(outcomes: dict[str, Exception | None]) -> GoogleClient:
+    class FakeEvents:
+        def delete(self, **_kwargs: Any) -> object:
+            return object()
+
+    class FakeService:
+        def events(self) -> FakeEvents:
+            return FakeEvents()
+
+        def new_batch_http_request(self, callback: Any) -> _FakeDeleteBatch:
+            return _FakeDeleteBatch(callback, outcomes)
+
+    client = GoogleClient(
+        calendar_id="primary",
+        client_secret_path=Path("secret.json"),
+        token_path=Path("token.json"),
+    )
+    client._service = FakeService()
+    return client
+
+
+def test_delete_events_reports_only_ids_that_are_gone() -> None:
+    client = _client_with_delete_outcomes({"g-fail": _http_error(500)})
+
+    gone = client.delete_events(["g-ok", "g-fail", "g-ok2"])
+
+    assert gone == {"g-ok", "g-ok2"}
+
+
+def test_delete_events_treats_404_and_410_as_already_gone() -> None:
+    client = _client_with_delete_outcomes({"g-404": _http_error(404), "g-410": _http_error(410)})
+
+    assert client.delete_events(["g-404", "g-410"]) == {"g-404", "g-410"}
+
+
+def test_delete_events_sends_each_repeated_id_once() -> None:
+    client = _client_with_delete_outcomes({})
+
+    assert client.delete_events(["g-1", "g-2", "g-1"]) == {"g-1", "g-2"}
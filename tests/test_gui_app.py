@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+QtCore = pytest.importorskip("PyQt6.QtCore")
+
+import bridgecal.gui_app as gui_app  # noqa: E402
+
+
+class _CompletedExecutor:
+    def submit(self, operation: Any) -> Future[object]:
+        future: Future[object] = Future()
+        future.set_result(operation())
+        return future
+
+
+def test_background_callbacks_wait_for_the_event_loop_when_already_done() -> None:
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    window: Any = SimpleNamespace(
+        _executor=_CompletedExecutor(),
+        _background_callbacks={},
+        _background_relay=gui_app._BackgroundResultRelay(),
+    )
+    window._run_background_callbacks = lambda future: (
+        gui_app.BridgeCalWindow._run_background_callbacks(window, future)
+    )
+    window._background_relay.delivered.connect(
+        lambda future: gui_app.BridgeCalWindow._deliver_background_result(window, future)
+    )
+    results: list[object] = []
+
+    started = gui_app.BridgeCalWindow._start_background_operation(
+        window,
+        operation=lambda: "Configured (Ready)",
+        on_success=results.append,
+        on_failure=results.append,
+    )
+
+    assert started is True
+    assert results == []
+    app.processEvents()
+    assert results == ["Configured (Ready)"]
+    assert window._background_callbacks == {}
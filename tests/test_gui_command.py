@@ -5,6 +5,11 @@ import pytest
 import bridgecal.commands.gui as gui_command
 
 
+@pytest.fixture(autouse=True)
+def _fresh_preload_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gui_command, "_PRELOADED", set())
+
+
 def test_preload_gui_ml_runtime_import_order(monkeypatch: pytest.MonkeyPatch) -> None:
     calls: list[str] = []
 
@@ -56,3 +61,17 @@ def test_preload_gui_ml_runtime_skips_missing_modules(
     gui_command._preload_gui_ml_runtime()
 
     assert calls == ["torch"]
+
+
+def test_preload_gui_ml_runtime_skips_modules_already_preloaded(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    monkeypatch.setattr(gui_command, "_module_exists", lambda _name: True)
+    monkeypatch.setattr(gui_command, "_import_runtime_module", calls.append)
+
+    gui_command._preload_gui_ml_runtime()
+    gui_command._preload_gui_ml_runtime()
+
+    assert calls == ["torch", "ctranslate2", "faster_whisper"]
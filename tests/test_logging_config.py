@@ -1,29 +1,43 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from logging.handlers import QueueHandler
 from pathlib import Path
 
-from bridgecal.logging_config import NOISY_OAUTH_LOGGERS, configure_logging
+from bridgecal.logging_config import NOISY_OAUTH_LOGGERS, configure_logging, shutdown_logging
 
 
-def test_configure_logging_sets_oauth_loggers_to_warning(tmp_path: Path) -> None:
+@contextmanager
+def _preserved_logging_state(logger_names: Iterable[str] = ()) -> Iterator[None]:
     root = logging.getLogger()
-    original_handlers = list(root.handlers)
-    original_root_level = root.level
-    original_levels = {
-        logger_name: logging.getLogger(logger_name).level for logger_name in NOISY_OAUTH_LOGGERS
-    }
-
+    handlers = list(root.handlers)
+    root_level = root.level
+    levels = {name: logging.getLogger(name).level for name in logger_names}
     try:
+        yield
+    finally:
+        shutdown_logging()
+        root.handlers[:] = handlers
+        root.setLevel(root_level)
+        for name, level in levels.items():
+            logging.getLogger(name).setLevel(level)
+
+
+def test_configure_logging_sets_oauth_loggers_to_warning(tmp_path: Path) -> None:
+    with _preserved_logging_state(NOISY_OAUTH_LOGGERS):
         configure_logging(tmp_path / "bridgecal.log", level="INFO")
         for logger_name in NOISY_OAUTH_LOGGERS:
             assert logging.getLogger(logger_name).level == logging.WARNING
-    finally:
-        current_root = logging.getLogger()
-        for handler in list(current_root.handlers):
-            current_root.removeHandler(handler)
-        current_root.setLevel(original_root_level)
-        for handler in original_handlers:
-            current_root.addHandler(handler)
-        for logger_name, level in original_levels.items():
-            logging.getLogger(logger_name).setLevel(level)
+
+
+def test_configure_logging_writes_file_through_queue_listener(tmp_path: Path) -> None:
+    log_path = tmp_path / "bridgecal.log"
+
+    with _preserved_logging_state():
+        configure_logging(log_path, level="INFO")
+        assert all(isinstance(handler, QueueHandler) for handler in logging.getLogger().handlers)
+        logging.getLogger("bridgecal.test").info("queued record")
+        shutdown_logging()
+        assert "queued record" in log_path.read_text(encoding="utf-8")
@@ -1,10 +1,40 @@
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from types import SimpleNamespace
+from typing import Any
+
+import pytest
 
 from bridgecal.outlook_client import OutlookClient, _extract_executable_path, _is_outlook_busy_error
 from bridgecal.sync.models import CanonicalEvent, EventTime
 
 
+@dataclass(slots=True)
+class _FakeAppointmentTimes:
+    AllDayEvent: bool
+    Start: datetime
+    End: datetime
+    StartUTC: datetime
+    EndUTC: datetime
+
+
+@dataclass(slots=True)
+class _FakeAppointment:
+    # Slots make an assignment to any property the fake does not model fail loudly.
+    Recipients: Any
+    MeetingStatus: int | None = None
+    Subject: str = ""
+    Location: str = ""
+    Body: str = ""
+    Sensitivity: int | None = None
+    BusyStatus: int | None = None
+    AllDayEvent: bool | None = None
+    Start: datetime | None = None
+    End: datetime | None = None
+    StartUTC: datetime | None = None
+    EndUTC: datetime | None = None
+
+
 def test_extract_executable_path_from_quoted_command() -> None:
     command = '"C:\\Program Files\\Microsoft Office\\Root\\Office16\\OUTLOOK.EXE" /embedding'
     assert (
@@ -39,7 +69,7 @@ def test_is_outlook_busy_error_with_other_error() -> None:
 
 
 def test_event_time_uses_startutc_for_timed_events() -> None:
-    item = SimpleNamespace(
+    item = _FakeAppointmentTimes(
         AllDayEvent=False,
         Start=datetime(2026, 2, 16, 17, 0, tzinfo=UTC),
         End=datetime(2026, 2, 16, 18, 0, tzinfo=UTC),
@@ -53,7 +83,7 @@ def test_event_time_uses_startutc_for_timed_events() -> None:
 
 
 def test_event_time_uses_wall_dates_for_all_day_events() -> None:
-    item = SimpleNamespace(
+    item = _FakeAppointmentTimes(
         AllDayEvent=True,
         Start=datetime(2026, 2, 16, 0, 0, tzinfo=UTC),
         End=datetime(2026, 2, 17, 0, 0, tzinfo=UTC),
@@ -73,18 +103,7 @@ def test_apply_source_to_appointment_sets_startutc_for_timed_events() -> None:
         def Remove(self, idx: int) -> None:
             raise AssertionError(f"unexpected recipient removal: {idx}")
 
-    item = SimpleNamespace(
-        MeetingStatus=None,
-        Recipients=_Recipients(),
-        Subject="",
-        Location="",
-        Body="",
-        Sensitivity=None,
-        BusyStatus=None,
-        AllDayEvent=None,
-        StartUTC=None,
-        EndUTC=None,
-    )
+    item = _FakeAppointment(Recipients=_Recipients())
     source = CanonicalEvent(
         origin="google",
         source_id="g1",
@@ -104,3 +123,54 @@ def test_apply_source_to_appointment_sets_startutc_for_timed_events() -> None:
     assert source.time.end_dt is not None
     assert item.StartUTC == source.time.start_dt.astimezone(UTC)
     assert item.EndUTC == source.time.end_dt.astimezone(UTC)
+
+
+def test_find_google_mirror_scans_calendar_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _Props:
+        def __init__(self, values: dict[str, str]) -> None:
+            self.values = values
+
+        def Find(self, name: str) -> SimpleNamespace | None:
+            value = self.values.get(name)
+            return None if value is None else SimpleNamespace(Value=value)
+
+    class _Items(list[Any]):
+        def Restrict(self, _filter: str) -> None:
+            raise RuntimeError("property is not a folder field")
+
+    mirror = SimpleNamespace(
+        UserProperties=_Props({"BridgeCalOrigin": "google", "BridgeCalGoogleId": "g1"})
+    )
+    native = SimpleNamespace(UserProperties=_Props({}))
+    folder_reads: list[int] = []
+
+    def fake_folder() -> SimpleNamespace:
+        folder_reads.append(1)
+        return SimpleNamespace(Items=_Items([native, mirror]))
+
+    client = OutlookClient()
+    monkeypatch.setattr(client, "_ensure_calendar_folder", fake_folder)
+
+    assert client._find_google_mirror("g1") is mirror
+    assert client._find_google_mirror("g2") is None
+    assert len(folder_reads) == 1
+
+
+def test_set_user_prop_registers_new_property_as_folder_field() -> None:
+    added: list[tuple[str, int, bool]] = []
+
+    class _Props:
+        def Find(self, _name: str) -> None:
+            return None
+
+        def Add(self, name: str, prop_type: int, add_to_folder_fields: bool) -> SimpleNamespace:
+            added.append((name, prop_type, add_to_folder_fields))
+            return SimpleNamespace(Value="")
+
+    OutlookClient()._set_user_prop(SimpleNamespace(UserProperties=_Props()), "BridgeCalOrigin", "x")
+
+    assert added == [("BridgeCalOrigin", 1, True)]
+
+
+def test_is_outlook_busy_error_with_retry_later_hresult() -> None:
+    assert _is_outlook_busy_error(Exception(-2147417846, "The application is busy.")) is True
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import threading
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
+import numpy as np
 import pytest
 
 import bridgecal.voice_stt as voice_stt_module
@@ -63,114 +65,377 @@ def test_transcribe_audio_file_surfaces_dependency_import_error(
         )
 
 
-def test_record_microphone_to_wav_uses_full_duration_without_stop(
+class FakeInputStream:
+    def __init__(self, device: FakeSoundDevice, callback: Any) -> None:
+        self.device = device
+        self.callback = callback
+
+    def __enter__(self) -> FakeInputStream:
+        remaining = self.device.feed_frames
+        while remaining > 0:
+            frames = min(self.device.blocksize, remaining)
+            self.callback(
+                np.full((frames, 1), self.device.level, dtype=np.float32), frames, None, None
+            )
+            remaining -= frames
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.device.closed = True
+
+
+class FakeSoundDevice:
+    def __init__(self, *, feed_frames: int, level: float) -> None:
+        self.feed_frames = feed_frames
+        self.level = level
+        self.blocksize = 0
+        self.closed = False
+
+    def InputStream(
+        self,
+        *,
+        samplerate: int,
+        channels: int,
+        dtype: str,
+        blocksize: int,
+        callback: Any,
+    ) -> FakeInputStream:
+        assert samplerate == 8000
+        assert channels == 1
+        assert dtype == "float32"
+        self.blocksize = blocksize
+        return FakeInputStream(self, callback)
+
+
+def test_record_microphone_to_array_uses_full_duration_without_stop(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    class FakeSoundDevice:
-        def __init__(self) -> None:
-            self.stop_called = False
-            self.wait_called = False
-
-        def rec(
-            self,
-            frame_count: int,
-            *,
-            samplerate: int,
-            channels: int,
-            dtype: str,
-        ) -> list[list[float]]:
-            assert samplerate == 8000
-            assert channels == 1
-            assert dtype == "float32"
-            return [[0.25] for _ in range(frame_count)]
-
-        def wait(self) -> None:
-            self.wait_called = True
-
-        def stop(self) -> None:
-            self.stop_called = True
-
-    class FakeSoundFile:
-        def __init__(self) -> None:
-            self.write_payload: Any = None
-
-        def write(self, path: str, payload: Any, sample_rate: int) -> None:
-            assert path.endswith(".wav")
-            assert sample_rate == 8000
-            self.write_payload = payload
-
-    fake_sounddevice = FakeSoundDevice()
-    fake_soundfile = FakeSoundFile()
+    # The device over-delivers; frames past the requested duration are dropped.
+    fake_sounddevice = FakeSoundDevice(feed_frames=9000, level=0.25)
 
+    monkeypatch.setattr(voice_stt_module, "_microphone_modules", lambda: (fake_sounddevice, np))
+
+    samples = voice_stt_module._record_microphone_to_array(seconds=1.0, sample_rate=8000)
+
+    assert fake_sounddevice.closed is True
+    assert samples.dtype == np.float32
+    assert len(samples) == 8000
+    assert float(samples[-1]) == 0.25
+
+
+def test_record_microphone_to_array_stops_early_when_stop_requested(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake_sounddevice = FakeSoundDevice(feed_frames=300, level=0.5)
+    stop_event = threading.Event()
+    stop_event.set()
+
+    monkeypatch.setattr(voice_stt_module, "_microphone_modules", lambda: (fake_sounddevice, np))
+
+    samples = voice_stt_module._record_microphone_to_array(
+        seconds=1.0,
+        sample_rate=8000,
+        stop_event=stop_event,
+    )
+
+    assert fake_sounddevice.closed is True
+    assert len(samples) == 300
+
+
+def test_transcribe_audio_array_resamples_and_streams_segments(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    received: list[Any] = []
+
+    class FakeModel:
+        def transcribe(self, audio: Any, **_kwargs: Any) -> tuple[list[Any], None]:
+            received.append(audio)
+            return [
+                SimpleNamespace(text=" hello "),
+                SimpleNamespace(text=" "),
+                SimpleNamespace(text="world"),
+            ], None
+
+    monkeypatch.setattr(voice_stt_module, "_whisper_model", lambda **_kwargs: FakeModel())
+    partials: list[str] = []
+
+    text = voice_stt_module.transcribe_audio_array(
+        np.zeros(8000, dtype=np.float32), 8000, language="en", on_partial=partials.append
+    )
+
+    assert text == "hello world"
+    assert partials == ["hello", "world"]
+    assert received[0].dtype == np.float32
+    assert len(received[0]) == 16_000
+
+
+def test_whisper_model_falls_back_to_int8_for_unsupported_compute_type(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    created: list[dict[str, Any]] = []
+
+    class FakeWhisperModel:
+        def __init__(self, model_size: str, **kwargs: Any) -> None:
+            if kwargs["compute_type"] != "int8":
+                raise ValueError(
+                    "Requested float16 compute type, but the target device or backend do not "
+                    "support efficient float16 computation."
+                )
+            created.append(kwargs)
+
+    fake_module = type("FakeFasterWhisper", (), {"WhisperModel": FakeWhisperModel})
     monkeypatch.setattr(
         voice_stt_module,
-        "_microphone_modules",
-        lambda: (fake_sounddevice, fake_soundfile),
+        "_load_optional_dependency",
+        lambda _name: voice_stt_module._DependencyLoadResult(module=fake_module),
     )
+    monkeypatch.setattr(voice_stt_module, "_MODEL_CACHE", {})
+    monkeypatch.setattr("bridgecal.voice_stt.os.cpu_count", lambda: 32)
 
-    output = voice_stt_module._record_microphone_to_wav(seconds=1.0, sample_rate=8000)
-    output.unlink(missing_ok=True)
+    model = voice_stt_module._whisper_model(model_size="small", compute_type="float16")
 
-    assert fake_sounddevice.wait_called is True
-    assert fake_sounddevice.stop_called is False
-    assert isinstance(fake_soundfile.write_payload, list)
-    assert len(fake_soundfile.write_payload) == 8000
+    assert isinstance(model, FakeWhisperModel)
+    assert created == [
+        {
+            "local_files_only": True,
+            "device": "cpu",
+            "compute_type": "int8",
+            "cpu_threads": 8,
+            "num_workers": 1,
+        }
+    ]
 
 
-def test_record_microphone_to_wav_stops_early_when_stop_requested(
+def test_prewarm_whisper_async_is_opt_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("BRIDGECAL_STT_WARMUP", raising=False)
+    monkeypatch.setattr(voice_stt_module, "_warmup_thread", None)
+
+    assert voice_stt_module.prewarm_whisper_async() is None
+
+
+def test_prewarm_whisper_async_loads_model_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    loads: list[tuple[str, str]] = []
+
+    def fake_prewarm(*, model_size: str, compute_type: str) -> None:
+        loads.append((model_size, compute_type))
+
+    monkeypatch.setenv("BRIDGECAL_STT_WARMUP", "1")
+    monkeypatch.setattr(voice_stt_module, "_warmup_thread", None)
+    monkeypatch.setattr(voice_stt_module, "_prewarm_whisper", fake_prewarm)
+
+    first = voice_stt_module.prewarm_whisper_async(model_size="tiny", compute_type="int8")
+    second = voice_stt_module.prewarm_whisper_async(model_size="tiny", compute_type="int8")
+    assert first is not None
+    first.join(timeout=5)
+
+    assert first is second
+    assert loads == [("tiny", "int8")]
+
+
+def test_load_optional_dependency_does_not_serialize_unrelated_imports(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    class FakeSoundDevice:
-        def __init__(self) -> None:
-            self.stop_called = False
-
-        def rec(
-            self,
-            frame_count: int,
-            *,
-            samplerate: int,
-            channels: int,
-            dtype: str,
-        ) -> list[list[float]]:
-            assert frame_count == 8000
-            assert samplerate == 8000
-            assert channels == 1
-            assert dtype == "float32"
-            return [[0.5] for _ in range(frame_count)]
-
-        def wait(self) -> None:
-            return None
-
-        def stop(self) -> None:
-            self.stop_called = True
-
-    class FakeSoundFile:
-        def __init__(self) -> None:
-            self.write_payload: Any = None
-
-        def write(self, path: str, payload: Any, sample_rate: int) -> None:
-            assert path.endswith(".wav")
-            assert sample_rate == 8000
-            self.write_payload = payload
-
-    fake_sounddevice = FakeSoundDevice()
-    fake_soundfile = FakeSoundFile()
-    stop_event = threading.Event()
-    stop_event.set()
+    slow_started = threading.Event()
+    release_slow = threading.Event()
+    imports: list[str] = []
+
+    def fake_import(module_name: str) -> object:
+        imports.append(module_name)
+        if module_name == "slow_mod":
+            slow_started.set()
+            assert release_slow.wait(timeout=5)
+        return SimpleNamespace(name=module_name)
+
+    monkeypatch.setattr(voice_stt_module, "_DEPENDENCY_CACHE", {})
+    monkeypatch.setattr(voice_stt_module, "import_module", fake_import)
+    monkeypatch.setattr(voice_stt_module, "_module_available", lambda _name: True)
+
+    results: list[voice_stt_module._DependencyLoadResult] = []
+    slow_loaders = [
+        threading.Thread(
+            target=lambda: results.append(voice_stt_module._load_optional_dependency("slow_mod"))
+        )
+        for _ in range(2)
+    ]
+    slow_loaders[0].start()
+    assert slow_started.wait(timeout=5)
+    slow_loaders[1].start()
+
+    fast = voice_stt_module._load_optional_dependency("fast_mod")
+    assert fast.module is not None
+
+    release_slow.set()
+    for loader in slow_loaders:
+        loader.join(timeout=5)
+
+    assert imports.count("slow_mod") == 1
+    assert len(results) == 2
+    assert results[0] is results[1]
+
+
+def test_prewarm_whisper_decodes_without_vad(monkeypatch: pytest.MonkeyPatch) -> None:
+    options: list[dict[str, Any]] = []
+
+    class FakeModel:
+        def transcribe(self, _audio: Any, **kwargs: Any) -> tuple[list[Any], None]:
+            options.append(kwargs)
+            return [], None
+
+    monkeypatch.setattr(voice_stt_module, "_whisper_model", lambda **_kwargs: FakeModel())
+    monkeypatch.setattr(voice_stt_module, "_require_dependency", lambda _name: np)
+    monkeypatch.delenv("BRIDGECAL_STT_VAD", raising=False)
+
+    voice_stt_module._prewarm_whisper(model_size="tiny", compute_type="int8")
+
+    assert [o["vad_filter"] for o in options] == [False]
+
+
+def test_module_available_caches_find_spec(monkeypatch: pytest.MonkeyPatch) -> None:
+    lookups: list[str] = []
+
+    def fake_find_spec(module_name: str) -> object | None:
+        lookups.append(module_name)
+        return None
+
+    monkeypatch.setattr("bridgecal.voice_stt.util.find_spec", fake_find_spec)
+    voice_stt_module._module_available.cache_clear()
 
+    assert voice_stt_module._module_available("not_installed_mod") is False
+    assert voice_stt_module._module_available("not_installed_mod") is False
+    assert lookups == ["not_installed_mod"]
+    voice_stt_module._module_available.cache_clear()
+
+
+def test_transcribe_respects_vad_toggle(monkeypatch: pytest.MonkeyPatch) -> None:
+    options: list[dict[str, Any]] = []
+
+    class FakeModel:
+        def transcribe(self, _audio: Any, **kwargs: Any) -> tuple[list[Any], None]:
+            options.append(kwargs)
+            return [SimpleNamespace(text="hi")], None
+
+    monkeypatch.setattr(voice_stt_module, "_whisper_model", lambda **_kwargs: FakeModel())
+
+    monkeypatch.setenv("BRIDGECAL_STT_VAD", "0")
+    voice_stt_module.transcribe_audio_file(Path("dummy.wav"), language="en")
+    monkeypatch.delenv("BRIDGECAL_STT_VAD")
+    voice_stt_module.transcribe_audio_file(Path("dummy.wav"), language="en")
+
+    assert [o["vad_filter"] for o in options] == [False, True]
+
+
+def test_resample_prefers_soxr_when_available(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[int, int]] = []
+
+    def fake_resample(samples: Any, in_rate: int, out_rate: int) -> Any:
+        calls.append((in_rate, out_rate))
+        return np.zeros(len(samples) // 3, dtype=np.float64)
+
+    fake_soxr = SimpleNamespace(resample=fake_resample)
+    real_loader = voice_stt_module._load_optional_dependency
+
+    def fake_loader(module_name: str) -> voice_stt_module._DependencyLoadResult:
+        if module_name == "soxr":
+            return voice_stt_module._DependencyLoadResult(module=fake_soxr)
+        return real_loader(module_name)
+
+    monkeypatch.setattr(voice_stt_module, "_load_optional_dependency", fake_loader)
+
+    resampled = voice_stt_module._resample_to_whisper_rate(np.zeros(48_000, np.float32), 48_000)
+
+    assert calls == [(48_000, 16_000)]
+    assert resampled.dtype == np.float32
+    assert len(resampled) == 16_000
+
+
+def test_transcribe_microphone_reuses_recording_buffer(monkeypatch: pytest.MonkeyPatch) -> None:
+    class FakeModel:
+        def transcribe(self, _audio: Any, **_kwargs: Any) -> tuple[list[Any], None]:
+            return [SimpleNamespace(text="ok")], None
+
+    fake_sounddevice = FakeSoundDevice(feed_frames=8000, level=0.1)
+    monkeypatch.setattr(voice_stt_module, "_microphone_modules", lambda: (fake_sounddevice, np))
+    monkeypatch.setattr(voice_stt_module, "_whisper_model", lambda **_kwargs: FakeModel())
+    monkeypatch.setattr(voice_stt_module, "_RECORD_BUFFERS", {})
+
+    voice_stt_module.transcribe_microphone(language="en", seconds=1.0, sample_rate=8000)
+    pooled = voice_stt_module._RECORD_BUFFERS[8000]
+    voice_stt_module.transcribe_microphone(language="en", seconds=1.0, sample_rate=8000)
+
+    assert voice_stt_module._RECORD_BUFFERS[8000] is pooled
+
+
+def test_whisper_model_downloads_when_no_local_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    attempts: list[bool] = []
+
+    class FakeWhisperModel:
+        def __init__(self, model_size: str, **kwargs: Any) -> None:
+            local_only = kwargs.get("local_files_only", False)
+            attempts.append(local_only)
+            if local_only:
+                raise FileNotFoundError("not cached")
+
+    fake_module = type("FakeFasterWhisper", (), {"WhisperModel": FakeWhisperModel})
     monkeypatch.setattr(
         voice_stt_module,
-        "_microphone_modules",
-        lambda: (fake_sounddevice, fake_soundfile),
+        "_load_optional_dependency",
+        lambda _name: voice_stt_module._DependencyLoadResult(module=fake_module),
     )
+    monkeypatch.setattr(voice_stt_module, "_MODEL_CACHE", {})
+    monkeypatch.setenv("BRIDGECAL_STT_VAD", "0")
 
-    output = voice_stt_module._record_microphone_to_wav(
-        seconds=1.0,
-        sample_rate=8000,
-        stop_event=stop_event,
+    model = voice_stt_module._whisper_model(model_size="tiny", compute_type="int8")
+
+    assert isinstance(model, FakeWhisperModel)
+    assert attempts == [True, False]
+
+
+def test_whisper_model_does_not_download_on_unrelated_load_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    attempts: list[bool] = []
+
+    class FakeWhisperModel:
+        def __init__(self, model_size: str, **kwargs: Any) -> None:
+            attempts.append(kwargs.get("local_files_only", False))
+            raise RuntimeError("corrupt model.bin")
+
+    fake_module = type("FakeFasterWhisper", (), {"WhisperModel": FakeWhisperModel})
+    monkeypatch.setattr(
+        voice_stt_module,
+        "_load_optional_dependency",
+        lambda _name: voice_stt_module._DependencyLoadResult(module=fake_module),
     )
-    output.unlink(missing_ok=True)
+    monkeypatch.setattr(voice_stt_module, "_MODEL_CACHE", {})
+
+    with pytest.raises(RuntimeError, match="corrupt"):
+        voice_stt_module._whisper_model(model_size="tiny", compute_type="int8")
+
+    assert attempts == [True]
+
+
+def test_whisper_model_does_not_retry_download_errors_as_compute_type(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class LocalEntryNotFoundError(FileNotFoundError, ValueError):
+        pass
+
+    attempts: list[tuple[bool, str]] = []
+
+    class FakeWhisperModel:
+        def __init__(self, model_size: str, **kwargs: Any) -> None:
+            attempts.append((kwargs.get("local_files_only", False), kwargs["compute_type"]))
+            raise LocalEntryNotFoundError("cannot reach the Hugging Face Hub")
+
+    fake_module = type("FakeFasterWhisper", (), {"WhisperModel": FakeWhisperModel})
+    monkeypatch.setattr(
+        voice_stt_module,
+        "_load_optional_dependency",
+        lambda _name: voice_stt_module._DependencyLoadResult(module=fake_module),
+    )
+    monkeypatch.setattr(voice_stt_module, "_MODEL_CACHE", {})
+
+    with pytest.raises(LocalEntryNotFoundError):
+        voice_stt_module._whisper_model(model_size="tiny", compute_type="float32")
 
-    assert fake_sounddevice.stop_called is True
-    assert isinstance(fake_soundfile.write_payload, list)
-    assert len(fake_soundfile.write_payload) == 1
+    assert attempts == [(True, "float32"), (False, "float32")]
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import subprocess
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
 
+import pytest
+
+import bridgecal.windows_scheduler as windows_scheduler
 from bridgecal.windows_scheduler import (
     _ps_single_quoted,
     build_register_task_script,
@@ -29,6 +35,8 @@ def test_build_register_task_script_contains_expected_values(tmp_path: Path) ->
     assert str(config_path) in script
     assert "-RunLevel Highest" in script
     assert "-IntervalSeconds $intervalSeconds" in script
+    assert "System32\\WindowsPowerShell\\v1.0\\powershell.exe" in script
+    assert "Get-Command" not in script
 
 
 def test_build_remove_task_script_contains_unregister() -> None:
@@ -36,3 +44,95 @@ def test_build_remove_task_script_contains_unregister() -> None:
 
     assert "BridgeCal Test Task" in script
     assert "Unregister-ScheduledTask" in script
+
+
+class _FakeComError(Exception):
+    def __init__(self, hresult: int) -> None:
+        super().__init__(hresult)
+        self.hresult = hresult
+
+
+class _FakePythoncom:
+    com_error = _FakeComError
+
+    def CoInitialize(self) -> None:
+        pass
+
+    def CoUninitialize(self) -> None:
+        pass
+
+
+def _patch_task_scheduler(
+    monkeypatch: pytest.MonkeyPatch, get_task: Any, dispatches: list[str]
+) -> None:
+    def dispatch(prog_id: str) -> SimpleNamespace:
+        dispatches.append(prog_id)
+        folder = SimpleNamespace(GetTask=get_task)
+        return SimpleNamespace(Connect=lambda: None, GetFolder=lambda _path: folder)
+
+    def fail_powershell(_command: str) -> subprocess.CompletedProcess[str]:
+        raise AssertionError("PowerShell should not be spawned")
+
+    monkeypatch.setattr("bridgecal.windows_scheduler.sys.platform", "win32")
+    monkeypatch.setattr(
+        windows_scheduler,
+        "_load_com_modules",
+        lambda: (_FakePythoncom(), SimpleNamespace(Dispatch=dispatch)),
+    )
+    monkeypatch.setattr(windows_scheduler, "_run_powershell", fail_powershell)
+    monkeypatch.setattr("bridgecal.windows_scheduler.time.monotonic", lambda: 100.0)
+    monkeypatch.setattr(windows_scheduler, "_STATUS_CACHE", {})
+
+
+def test_query_scheduler_status_reads_task_state_over_com_and_caches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dispatches: list[str] = []
+    _patch_task_scheduler(monkeypatch, lambda _name: SimpleNamespace(State=3), dispatches)
+
+    assert windows_scheduler.query_scheduler_status() == "Configured (Ready)"
+    assert windows_scheduler.query_scheduler_status() == "Configured (Ready)"
+    assert dispatches == ["Schedule.Service"]
+
+
+def test_query_scheduler_status_reports_missing_task_without_powershell(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def missing_task(_name: str) -> SimpleNamespace:
+        raise _FakeComError(windows_scheduler.TASK_NOT_FOUND_HRESULT)
+
+    _patch_task_scheduler(monkeypatch, missing_task, [])
+
+    assert windows_scheduler.query_scheduler_status() == "Not configured"
+
+
+def test_query_scheduler_status_falls_back_to_powershell_without_pywin32(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    commands: list[str] = []
+
+    def fake_powershell(command: str) -> subprocess.CompletedProcess[str]:
+        commands.append(command)
+        return subprocess.CompletedProcess([], 0, stdout="Not configured\n", stderr="")
+
+    monkeypatch.setattr("bridgecal.windows_scheduler.sys.platform", "win32")
+    monkeypatch.setattr(windows_scheduler, "_load_com_modules", lambda: None)
+    monkeypatch.setattr(windows_scheduler, "_run_powershell", fake_powershell)
+    monkeypatch.setattr(windows_scheduler, "_STATUS_CACHE", {})
+
+    assert windows_scheduler.query_scheduler_status() == "Not configured"
+    assert len(commands) == 1
+
+
+def test_find_repo_root_is_memoized(tmp_path: Path) -> None:
+    (tmp_path / "pyproject.toml").write_text("", encoding="utf-8")
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "run-bridgecal-daemon.ps1").write_text("", encoding="utf-8")
+    nested = tmp_path / "src" / "pkg"
+    nested.mkdir(parents=True)
+
+    assert windows_scheduler.find_repo_root(nested) == tmp_path
+    (tmp_path / "pyproject.toml").unlink()
+    assert windows_scheduler.find_repo_root(nested) == tmp_path
+    windows_scheduler.find_repo_root.cache_clear()
+    assert windows_scheduler.find_repo_root(nested) is None